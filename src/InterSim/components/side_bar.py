@@ -23,8 +23,17 @@ weekday_labels = {0: "Monday",
                   5: "Saturday",
                   6: "Sunday"}
 
-def _get_time_range(window_bounds):
-    selection_range = {(window_bounds[0]+timedelta(seconds=i)).time() : (window_bounds[0]+timedelta(seconds=i)) for i in range((window_bounds[1] - window_bounds[0]).seconds+1)}
+# granularity of the timing slider; one option per second made windows of several hours unusably slow
+slider_resolution_seconds = 60
+
+def _get_time_range(window_bounds, pinned=(), resolution=slider_resolution_seconds):
+    # offsets are quantized to `resolution`, but the window end and any pinned times (e.g. the current bounds
+    # of the activity, which must be valid slider values) are always kept as options
+    span = (window_bounds[1] - window_bounds[0]).seconds
+    offsets = set(range(0, span+1, resolution))
+    offsets.add(span)
+    offsets.update((moment - window_bounds[0]).seconds for moment in pinned)
+    selection_range = {(window_bounds[0]+timedelta(seconds=i)).time() : (window_bounds[0]+timedelta(seconds=i)) for i in sorted(offsets)}
     return selection_range
 
 def draw(plot_ref):
@@ -45,8 +54,10 @@ def draw(plot_ref):
                         msg = st.session_state["sim"].auto_step(timesteps[speed_selection])
                         # toastr pop the msg
                     timestamp.info(f'{weekday_labels[st.session_state["sim"].env.timestamp.weekday()]}  \n {st.session_state["sim"].env.timestamp}')
-                    st.session_state['renderer'].draw()
-                    plot_ref.plotly_chart(st.session_state['renderer'].fig, use_container_width=True, config=plotly_config)
+                    # a step that did not advance the clock moved nobody, so the frame on screen is still current
+                    if st.session_state['renderer'].dirty:
+                        st.session_state['renderer'].draw()
+                        plot_ref.plotly_chart(st.session_state['renderer'].fig, use_container_width=True, config=plotly_config)
 
     # agent display widget
     agent_control_widget()
@@ -65,10 +76,21 @@ def agent_control_widget():
                 f'Lon: {aa.lon}, Lat: {aa.lat}')
 
 
+        # split the upcoming schedule into editable events and open (idle) slots in a single pass
+        schedule = {}
+        open_slots = {}
+        now = st.session_state["sim"].env.timestamp
+        for activity in si.get_schedule(aa):
+            if activity.start_time < now or activity.name == "sleep":
+                continue
+            label = activity.name+"@"+str(activity.start_time.date())+"  \n "+str(activity.start_time.time())+"-"+str(activity.end_time.time())
+            if activity.name == "idle":
+                open_slots[label] = activity
+            else:
+                schedule[label] = activity
+
         #editing pane
         st.header("Edit events")
-        schedule = {activity.name+"@"+str(activity.start_time.date())+"  \n "
-                                +str(activity.start_time.time())+"-"+str(activity.end_time.time()) : activity for activity in si.get_schedule(aa) if activity.start_time >= st.session_state["sim"].env.timestamp and activity.name != "idle" and activity.name != "sleep"}
         schedule_selection = st.selectbox(label="Daily activites",
                                       options=schedule.keys(),
                                       index=0)  # and activity.start_time < datetime.fromtimestamp(st.session_state["sim"].env.now + timesteps["24 hours"])
@@ -76,10 +98,7 @@ def agent_control_widget():
         if schedule_selection is not None:
             #change location pane
             current_location = schedule[schedule_selection].location.name if schedule_selection is not None and schedule[schedule_selection].location is not None else None
-            if current_location in st.session_state["sim"].locations.keys():
-                index = list(st.session_state["sim"].locations.keys()).index(current_location)
-            else:
-                index = 0
+            index = st.session_state["sim"].location_index.get(current_location, 0)
 
             st.write(f'Location set {current_location if current_location is not None else "Nowhere"}')
             location_selection = st.selectbox(label="Location",
@@ -93,7 +112,7 @@ def agent_control_widget():
 
             #change timing pane
             window_bounds = si.get_editable_range(aa, schedule[schedule_selection])
-            window = _get_time_range(window_bounds)
+            window = _get_time_range(window_bounds, pinned=(schedule[schedule_selection].start_time, schedule[schedule_selection].end_time))
             new_start, new_end = st.select_slider("Bounds",
                                                     options=window,
                                                     value=(schedule[schedule_selection].start_time.time(), schedule[schedule_selection].end_time.time()))
@@ -114,10 +133,6 @@ def agent_control_widget():
         activity_type = st.selectbox(label="Event Type",
                                      options=ACTIVITIES,
                                      index=0)
-        open_slots = {activity.name + "@" + str(activity.start_time.date()) + "  \n "
-                      + str(activity.start_time.time()) + "-" + str(activity.end_time.time()): activity for activity
-                      in si.get_schedule(aa) if
-                      activity.start_time >= st.session_state["sim"].env.timestamp and activity.name == "idle"}
         slot_selection = st.selectbox(label="Open Timeslots",
                                       options=open_slots.keys(),
                                       index=0)
@@ -1,10 +1,16 @@
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import descartes
-import random as random
-from mpl_toolkits.axisartist.axislines import Subplot
-from shapely.geometry import Point, Polygon
-import plotly.express as px
+import plotly.graph_objects as go
+
+marker_size_max = 20  # largest marker, in pixels (same as the plotly express default)
+coordinate_decimals = 1  # the city spans ~1000 units and people are jittered by +/-1, finer detail is invisible
+
+
+def _quantize(coordinates):
+    # figures are sent to the browser as JSON, so fewer significant digits means a much smaller payload.
+    # stays float64: the stdlib json encoder writes float32 values at full float64 length
+    return np.round(coordinates, coordinate_decimals)
+
 
 class visualizer:
     def __init__(self, sim):
@@ -23,60 +29,145 @@ class visualizer:
         self.misc_ref = [misc for misc in sim.city.miscs]
 
         # people data
-        self.humans = {human.name : human for human in sim.city.humans}
+        self._humans_by_name = None  # built lazily, drawing only needs the list below
+        # per-step buffers: positions/liveness are refreshed in a single pass, then filtered with a mask
+        self._human_refs = list(sim.city.humans)
+        self._names = np.array([human.name for human in self._human_refs], dtype=object)
+        # supervision is settled when the planners are initialized, so the labels never change afterwards
+        self._types = np.where([human.mobility_planner.follows_adult_schedule for human in self._human_refs],
+                               "child", "adult").astype(object)
+        self._lon = np.empty(len(self._human_refs), dtype=np.float64)
+        self._lat = np.empty(len(self._human_refs), dtype=np.float64)
+        self._alive = np.empty(len(self._human_refs), dtype=bool)
+        self._rng = np.random.default_rng()  # jitter only, so that people in the same building don't overlap
+
+        # positions only change while the simulation clock runs, so a frame is stale only once `env.now` moved
+        self.env = sim.env
+        self._drawn_at = None
 
         # config
         self.building_radius = 7.0
         self.person_radius = 1.0
+        self.density_threshold = 5000  # above this many living humans, people are drawn as a density map
+        self.density_bins = 200
 
         #plot
-        self.fig = None#go.Figure()#plt.figure(figsize=(15, 15))
+        self._people_traces = {}
+        self._density_traces = {}
         #self.ax = self.fig.add_subplot()
 
         self.building_df = self._init_buildings()
+        self.fig = self._init_figure()
         self.draw()
         #self.draw()
         #self.ax.scatter(self.building_df.x, self.building_df.y, s=self.building_df.radius, c=self.building_df.colour)
 
-    def _compile_building(self, building_arr, type):
-        return pd.DataFrame({'x': [building.lon for building in building_arr],
-                           'y': [building.lat for building in building_arr],
-                           'radius': [self.building_radius for building in building_arr],
-                           'name': [building.name for building in building_arr],
-                           'type': [type for building in building_arr]})
-        #building_layer.scatter(df.x, df.y, s=self.building_radius, c=colour)
+    @property
+    def humans(self):
+        if self._humans_by_name is None:
+            self._humans_by_name = {human.name : human for human in self._human_refs}
+        return self._humans_by_name
+
+    @property
+    def dirty(self):
+        return self._drawn_at != self.env.now
 
     def _init_buildings(self):
-        building_set = self._compile_building(self.school_ref, "school")
-        building_set = building_set.append(self._compile_building(self.hospital_ref, "hospital"))
-        building_set = building_set.append(self._compile_building(self.park_ref, "park"))
-        building_set = building_set.append(self._compile_building(self.store_ref, "store"))
-        building_set = building_set.append(self._compile_building(self.workplace_ref, "workplace"))
-        building_set = building_set.append(self._compile_building(self.senior_residence_ref, "senior_residence"))
-        building_set = building_set.append(self._compile_building(self.home_ref, "home"))
-        building_set = building_set.append(self._compile_building(self.misc_ref, "misc"))
-        return building_set
+        # all building groups are written into one set of preallocated columns, and the frame is built once
+        groups = [(self.school_ref, "school"),
+                  (self.hospital_ref, "hospital"),
+                  (self.park_ref, "park"),
+                  (self.store_ref, "store"),
+                  (self.workplace_ref, "workplace"),
+                  (self.senior_residence_ref, "senior_residence"),
+                  (self.home_ref, "home"),
+                  (self.misc_ref, "misc")]
+        total = sum(len(buildings) for buildings, _ in groups)
+        x = np.empty(total, dtype=np.float64)
+        y = np.empty(total, dtype=np.float64)
+        names = np.empty(total, dtype=object)
+        types = np.empty(total, dtype=object)
+        offset = 0
+        for buildings, type in groups:
+            for i, building in enumerate(buildings, start=offset):
+                x[i] = building.lon
+                y[i] = building.lat
+                names[i] = building.name
+            types[offset:offset + len(buildings)] = type
+            offset += len(buildings)
+        return pd.DataFrame({'x': _quantize(x),
+                             'y': _quantize(y),
+                             'radius': np.full(total, self.building_radius, dtype=np.float32),
+                             'name': names,
+                             'type': types}, copy=False)
+
+    def _init_figure(self):
+        # buildings never change, so they are plotted once; draw() only updates the people traces in place.
+        # categories are fixed, so each one gets its own trace with a fixed colour instead of letting
+        # plotly express group the frame by "type" and resolve the colour map on every call
+        fig = go.Figure()
+        # same area scaling for every trace, so buildings and people keep their relative size
+        sizeref = 2.0 * max(self.building_radius, self.person_radius) / marker_size_max ** 2
+        types = self.building_df["type"].to_numpy()
+        for category in building_categories:
+            mask = types == category
+            fig.add_trace(go.Scattergl(x=self.building_df["x"].to_numpy()[mask],
+                                       y=self.building_df["y"].to_numpy()[mask],
+                                       hovertext=self.building_df["name"].to_numpy()[mask],
+                                       mode="markers", name=category, legendgroup=category, hoverinfo="text",
+                                       marker=dict(color=plot_pallet[category], size=self.building_radius,
+                                                   sizemode="area", sizeref=sizeref)))
+
+        for category in people_categories:
+            fig.add_trace(go.Scattergl(x=[], y=[], hovertext=[], mode="markers", name=category,
+                                       legendgroup=category, hoverinfo="text",
+                                       marker=dict(color=plot_pallet[category], size=self.person_radius,
+                                                   sizemode="area", sizeref=sizeref)))
+            self._people_traces[category] = fig.data[-1]
+            fig.add_trace(go.Heatmap(z=[], x=[], y=[], visible=False, showscale=False,
+                                     colorscale=[[0.0, "white"], [1.0, plot_pallet[category]]],
+                                     name=category, legendgroup=category,
+                                     hovertemplate=category + ": %{z}<extra></extra>"))
+            self._density_traces[category] = fig.data[-1]
+
+        # constant uirevision: the browser keeps zoom/pan and legend state across redraws instead of resetting them
+        fig.update_layout(dragmode="pan", uirevision="static", legend_title_text="type")
+        return fig
 
     def draw(self):
-        living = [human for human in self.humans.values() if not human.is_dead]
-        people_set = pd.DataFrame({'x': [float(human.lon)+random.uniform(-1.0, 1.0) for human in living],
-                           'y': [float(human.lat)+random.uniform(-1.0, 1.0) for human in living],
-                           'radius': [self.person_radius for human in living],
-                           'name': [human.name for human in living],
-                           'type': ["child" if human.mobility_planner.follows_adult_schedule else "adult" for human in living]})
-
-
-        joint_set = self.building_df.append(people_set)
-        try:
-            self.fig = px.scatter(joint_set, x="x", y="y", size="radius", hover_name="name", color="type",
-                                  color_discrete_map=plot_pallet)
-        except ValueError:
-            self.fig = px.scatter(joint_set, x="x", y="y", size="radius", hover_name="name", color="type",
-                                  color_discrete_map=plot_pallet)
-
-        self.fig.update_layout(dragmode="pan")
-        #self.fig = px.scatter(joint_set, x="x", y="y", color="colour", size="radius", hover_name="name")
-        #self.ax.scatter(joint_set.x, joint_set.y, s=joint_set.radius, c=joint_set.colour)
+        self._drawn_at = self.env.now
+        for i, human in enumerate(self._human_refs):
+            self._lon[i] = human.lon
+            self._lat[i] = human.lat
+            self._alive[i] = not human.is_dead
+        n_living = int(self._alive.sum())
+        x = _quantize(self._lon[self._alive] + self._rng.uniform(-1.0, 1.0, n_living))
+        y = _quantize(self._lat[self._alive] + self._rng.uniform(-1.0, 1.0, n_living))
+        names = self._names[self._alive]
+        types = self._types[self._alive]
+
+        # with too many people, individual markers mostly overlap; aggregate them on a fixed grid instead
+        aggregate_people = n_living > self.density_threshold
+
+        with self.fig.batch_update():
+            for category in people_categories:
+                mask = types == category
+                scatter = self._people_traces[category]
+                density = self._density_traces[category]
+                scatter.visible = not aggregate_people
+                density.visible = aggregate_people
+                if aggregate_people:
+                    density.z, density.x, density.y = self._density(x[mask], y[mask])
+                    scatter.x, scatter.y, scatter.hovertext = [], [], []
+                else:
+                    scatter.x, scatter.y, scatter.hovertext = x[mask], y[mask], names[mask]
+                    density.z, density.x, density.y = [], [], []
+
+    def _density(self, x, y):
+        counts, x_edges, y_edges = np.histogram2d(x, y, bins=self.density_bins)
+        counts = np.where(counts > 0, counts, np.nan).T  # empty cells stay transparent; rows are y
+        return counts, (x_edges[:-1] + x_edges[1:]) / 2, (y_edges[:-1] + y_edges[1:]) / 2
+
 
 plot_pallet = {"hospital": "red",
                 "park": "yellow",
@@ -87,4 +178,6 @@ plot_pallet = {"hospital": "red",
                 "home": "green",
                 "misc": "maroon",
                 "adult": "blue",
-                "child": "teal"}
\ No newline at end of file
+                "child": "teal"}
+building_categories = ("school", "hospital", "park", "store", "workplace", "senior_residence", "home", "misc")
+people_categories = ("adult", "child")
\ No newline at end of file
@@ -12,7 +12,7 @@ from collections import defaultdict
 from orderedset import OrderedSet
 
 from covid19sim.utils.mobility_planner import MobilityPlanner
-from covid19sim.utils.utils import proba_to_risk_fn
+from covid19sim.utils.utils import cached_proba_to_risk_fn
 from covid19sim.locations.city import PersonalMailboxType
 from covid19sim.locations.hospital import Hospital, ICU
 from covid19sim.interactivity.interactive_planner import InteractivePlanner
@@ -195,9 +195,8 @@ class Human(BaseHuman):
         self.risk_history_map = dict()  # 14-day risk history (estimated infectiousness) updated inside the human's (current) timeslot
         self.prev_risk_history_map = dict()  # used to check how the risk changed since the last timeslot
         self.last_sent_update_gaen = 0  # Used for modelling the Googe-Apple Exposure Notification protocol
-        risk_mapping_array = np.array(self.conf.get('RISK_MAPPING'))  # mapping from float risk value to risk level
-        assert len(risk_mapping_array) > 0, "risk mapping must always be defined!"
-        self.proba_to_risk_level_map = proba_to_risk_fn(risk_mapping_array)
+        # mapping from float risk value to risk level (shared by all humans with the same mapping)
+        self.proba_to_risk_level_map = cached_proba_to_risk_fn(tuple(self.conf.get('RISK_MAPPING')))
 
         ###Mobility###
         self.rho = conf['RHO']  # controls mobility (how often this person goes out and visits new places)
@@ -5,6 +5,8 @@ Handles querying the inference server with serialized humans and their messages.
 import datetime
 import os
 import functools
+import itertools
+import math
 import typing
 from joblib import Parallel, delayed
 
@@ -70,17 +72,14 @@ def batch_run_timeslot_heavy_jobs(
     assert current_day_idx >= 0
 
     hd = next(iter(humans)).city.hd
-    all_params = []
 
-    for human in humans:
-        if (
-            not human.has_app
-            or time_slot not in human.time_slots
-            or human.is_dead
-        ):
-            continue
-
-        all_params.append({
+    # filter first, then build all packets in a single comprehension (no per-human list growth)
+    active_humans = [
+        human for human in humans
+        if human.has_app and time_slot in human.time_slots and not human.is_dead
+    ]
+    all_params = [
+        {
             "start": init_timestamp,
             "current_day": current_day_idx,
             "human": make_human_as_message(
@@ -91,32 +90,37 @@ def batch_run_timeslot_heavy_jobs(
             "time_slot": time_slot,
             "conf": conf,
             "city_hash": city_hash,
-        })
+        }
+        for human in active_humans
+    ]
 
     if conf.get('USE_INFERENCE_SERVER'):
-        batch_start_offset = 0
-        batch_size = conf.get('INFERENCE_REQ_BATCH_SIZE', 100)
-        batched_params = []
-        while batch_start_offset < len(all_params):
-            batch_end_offset = min(batch_start_offset + batch_size, len(all_params))
-            batched_params.append(all_params[batch_start_offset:batch_end_offset])
-            batch_start_offset += batch_size
+        # INFERENCE_REQ_BATCH_SIZE is only an upper bound: with few active humans, we shrink the
+        # batches so that every parallel request slot gets some work instead of one large batch
+        max_batch_size = conf.get('INFERENCE_REQ_BATCH_SIZE', 100)
         parallel_reqs = conf.get('INFERENCE_REQ_PARALLEL_JOBS', 16)
+        batch_size = max(min(max_batch_size, math.ceil(len(all_params) / max(parallel_reqs, 1))), 1)
+        batched_params = [
+            all_params[offset:offset + batch_size]
+            for offset in range(0, len(all_params), batch_size)
+        ]
         parallel_reqs = max(min(parallel_reqs, len(batched_params)), 1)
 
         def query_inference_server(params, **inf_client_kwargs):
-            # lambda used to create one socket per request (so we can request in parallel)
+            # lambda used to create one socket per request (so we can request in parallel);
+            # REQ sockets cannot pipeline, but they all hang off the same shared zmq context
             client = InferenceClient(**inf_client_kwargs)
-            return client.infer(params)
+            try:
+                return client.infer(params)
+            finally:
+                client.socket.close()
 
         inference_frontend_address = conf.get('INFERENCE_SERVER_ADDRESS', None)
         query_func = functools.partial(query_inference_server, server_address=inference_frontend_address)
 
         with Parallel(n_jobs=parallel_reqs, prefer="threads") as parallel:
             batched_results = parallel((delayed(query_func)(params) for params in batched_params))
-        results = []
-        for b in batched_results:
-            results.extend(b)
+        results = list(itertools.chain.from_iterable(batched_results))
     else:
         cluster_mgr_map = DummyMemManager.get_cluster_mgr_map()
         engine = DummyMemManager.get_engine(conf)
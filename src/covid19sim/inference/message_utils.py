@@ -34,10 +34,10 @@ def create_new_uid(rng=None) -> UIDType:
         return UIDType(rng.randint(0, 1 << message_uid_bit_count))
     else:
         assert (message_uid_bit_count % 32) == 0, "missing implementation"
-        uid, bits_left = 0, message_uid_bit_count
-        while bits_left > 0:
-            uid += rng.randint(0, 1 << 32) << (bits_left - 32)
-            bits_left -= 32
+        # draw all 32-bit words at once (same stream as one randint call per word), most significant first
+        uid = 0
+        for word in rng.randint(0, 1 << 32, size=message_uid_bit_count // 32).tolist():
+            uid = (uid << 32) + word
         return uid
 
 
@@ -438,12 +438,16 @@ class ContactBook:
         Returns:
             The risk level change score (a numeric value).
         """
-        change = 0
-        for day_idx in set(prev_risk_history_map.keys()) & set(curr_risk_history_map.keys()):
-            old_risk_level = min(proba_to_risk_level_map(prev_risk_history_map[day_idx]), 15)
-            curr_risk_level = min(proba_to_risk_level_map(curr_risk_history_map[day_idx]), 15)
-            n_encs_for_day = len(self.encounters_by_day.get(day_idx, []))
-            change += abs(curr_risk_level - old_risk_level) * n_encs_for_day
+        day_idxs = list(set(prev_risk_history_map.keys()) & set(curr_risk_history_map.keys()))
+        if not day_idxs:
+            return 0
+        # map all days to risk levels in one vectorized lookup instead of one call per day
+        old_risk_levels = np.minimum(proba_to_risk_level_map(
+            np.asarray([prev_risk_history_map[day_idx] for day_idx in day_idxs])), 15)
+        curr_risk_levels = np.minimum(proba_to_risk_level_map(
+            np.asarray([curr_risk_history_map[day_idx] for day_idx in day_idxs])), 15)
+        n_encs_per_day = np.asarray([len(self.encounters_by_day.get(day_idx, [])) for day_idx in day_idxs])
+        change = int((np.abs(curr_risk_levels - old_risk_levels) * n_encs_per_day).sum())
         return change  # Danger potential PII => fewer bits
 
     def cleanup_contacts(
@@ -541,14 +545,23 @@ class ContactBook:
         if intervention is None:
             return update_messages  # no need to generate update messages until tracing is enabled
         assert current_day_idx >= 0
-        for encounter_day_idx, encounter_messages in self.encounters_by_day.items():
+        encounter_day_idxs = list(self.encounters_by_day.keys())
+        if not encounter_day_idxs:
+            return update_messages
+        for encounter_day_idx in encounter_day_idxs:
             assert current_day_idx - encounter_day_idx <= self.tracing_n_days_history, \
                 "contact book should have been cleaned up before calling update method...?"
             if encounter_day_idx not in prev_risk_history_map.keys():
+                # no previous level for that day; copying the current one means no update is sent
                 prev_risk_history_map[encounter_day_idx] = curr_risk_history_map[encounter_day_idx]
-                continue
-            old_risk_level = min(proba_to_risk_level_map(prev_risk_history_map[encounter_day_idx]), 15)
-            new_risk_level = min(proba_to_risk_level_map(curr_risk_history_map[encounter_day_idx]), 15)
+        # map all days to risk levels in one vectorized lookup instead of one call per day
+        old_risk_levels = np.minimum(proba_to_risk_level_map(
+            np.asarray([prev_risk_history_map[day_idx] for day_idx in encounter_day_idxs])), 15)
+        new_risk_levels = np.minimum(proba_to_risk_level_map(
+            np.asarray([curr_risk_history_map[day_idx] for day_idx in encounter_day_idxs])), 15)
+        for encounter_day_idx, old_risk_level, new_risk_level in \
+                zip(encounter_day_idxs, old_risk_levels.tolist(), new_risk_levels.tolist()):
+            encounter_messages = self.encounters_by_day[encounter_day_idx]
             if old_risk_level != new_risk_level:
                 for encounter_idx, encounter_message in enumerate(encounter_messages):
                     assert encounter_message.risk_level is not None, \
@@ -15,6 +15,7 @@ import pickle
 import platform
 import subprocess
 import sys
+import threading
 import time
 import typing
 import xdelta3
@@ -36,6 +37,7 @@ expected_processed_packet_param_names = [
 ]
 
 default_poll_delay_ms = 500
+default_pickle_protocol = pickle.HIGHEST_PROTOCOL  # protocol 5 on py3.8+, much faster than dill/default
 default_data_buffer_size = ((10 * 1024) * 1024)  # 10MB
 
 if os.environ.get("RAVEN_DIR", None) is not None:
@@ -232,7 +234,7 @@ class InferenceWorker(BaseWorker):
                     engine=engine,
                     cluster_mgr_map=self.cluster_mgr_map,
                 )
-                response = pickle.dumps(response)
+                response = pickle.dumps(response, protocol=default_pickle_protocol)
                 socket.send_multipart([address, b"", response])
                 with self.time_counter.get_lock():
                     self.time_counter.value += time.time() - proc_start_time
@@ -369,7 +371,9 @@ class InferenceClient:
 
     This object will automatically be able to pick a proper remote inference
     engine. This object should be fairly lightweight and low-cost, so creating
-    it once per day, per human *should* not create a significant overhead.
+    it once per day, per human *should* not create a significant overhead. All
+    clients share the process-wide zmq context unless one is given, so only the
+    (cheap) socket is created per client.
     """
 
     def __init__(
@@ -382,10 +386,10 @@ class InferenceClient:
 
         Args:
             server_address: address of the inference server frontend to send requests to.
-            context: zmq context to create i/o objects from.
+            context: zmq context to create i/o objects from (defaults to the shared instance).
         """
         if context is None:
-            context = zmq.Context()
+            context = zmq.Context.instance()
         self.context = context
         self.socket = self.context.socket(zmq.REQ)
         if server_address is None:
@@ -394,7 +398,7 @@ class InferenceClient:
 
     def infer(self, sample):
         """Forwards a data sample for the inference engine using pickle."""
-        self.socket.send_pyobj(sample)
+        self.socket.send_pyobj(sample, protocol=default_pickle_protocol)
         return self.socket.recv_pyobj()
 
     def request_reset(self):
@@ -695,10 +699,10 @@ class DataCollectionClient:
 
         Args:
             server_address: address of the data collection server frontend to send requests to.
-            context: zmq context to create i/o objects from.
+            context: zmq context to create i/o objects from (defaults to the shared instance).
         """
         if context is None:
-            context = zmq.Context()
+            context = zmq.Context.instance()
         self.context = context
         self.socket = self.context.socket(zmq.REQ)
         if server_address is None:
@@ -725,6 +729,18 @@ class DataCollectionServer(DataCollectionBroker, multiprocessing.Process):
         DataCollectionBroker.__init__(self, **kwargs)
 
 
+_data_collect_clients = {}  # (pid, thread id, address) -> client, reused across humans & batches
+
+
+def _get_data_collect_client(server_address):
+    """Returns a data collection client that is reused by the calling process/thread for that address."""
+    # REQ sockets must not be shared across threads, and should not survive a fork
+    key = (os.getpid(), threading.get_ident(), server_address)
+    if key not in _data_collect_clients:
+        _data_collect_clients[key] = DataCollectionClient(server_address=server_address)
+    return _data_collect_clients[key]
+
+
 def proc_human_batch(
         sample,
         engine,
@@ -852,8 +868,8 @@ def _proc_human(params, inference_engine):
     }
 
     if conf.get("COLLECT_TRAINING_DATA"):
-        data_collect_client = DataCollectionClient(
-            server_address=conf.get("data_collection_server_address", default_datacollect_frontend_address),
+        data_collect_client = _get_data_collect_client(
+            conf.get("data_collection_server_address", default_datacollect_frontend_address),
         )
         human_id = int(human.name.split(":")[-1])
         data_collect_client.write(params["current_day"], params["time_slot"], human_id, daily_output)
@@ -20,7 +20,8 @@ from covid19sim.utils.constants import SECONDS_PER_DAY, SECONDS_PER_HOUR
 from covid19sim.utils.mobility_planner import ACTIVITIES
 from covid19sim.log.console_logger import ConsoleLogger
 from covid19sim.inference.server_utils import DataCollectionServer
-from covid19sim.utils.utils import dump_conf, dump_tracker_data, extract_tracker_data, parse_configuration, log
+from covid19sim.utils.utils import dump_conf, dump_tracker_data, extract_tracker_data, parse_configuration, log, \
+    get_next_free_outdir
 
 from covid19sim.interactivity.agent_interface import PeopleManager
 
@@ -50,31 +51,37 @@ def _get_intervention_string(conf):
     risk_model = conf['RISK_MODEL']
     n_behavior_levels = conf['N_BEHAVIOR_LEVELS']
     hhld_behavior = conf['MAKE_HOUSEHOLD_BEHAVE_SAME_AS_MAX_RISK_RESIDENT']
-    type_of_run = f"{risk_model} | HHLD_BEHAVIOR_SAME_AS_MAX_RISK_RESIDENT: {hhld_behavior} | N_BEHAVIOR_LEVELS:{n_behavior_levels} |"
+    parts = [f"{risk_model} | HHLD_BEHAVIOR_SAME_AS_MAX_RISK_RESIDENT: {hhld_behavior} | N_BEHAVIOR_LEVELS:{n_behavior_levels} |"]
     if risk_model == "digital":
-        type_of_run += f" N_LEVELS_USED: 2 (1st and last) |"
-        type_of_run += f" TRACING_ORDER:{conf['TRACING_ORDER']} |"
-        type_of_run += f" TRACE_SYMPTOMS: {conf['TRACE_SYMPTOMS']} |"
-        type_of_run += f" INTERPOLATE_USING_LOCKDOWN_CONTACTS:{conf['INTERPOLATE_CONTACTS_USING_LOCKDOWN_CONTACTS']} |"
-        type_of_run += f" MODIFY_BEHAVIOR: {conf['SHOULD_MODIFY_BEHAVIOR']}"
-        return type_of_run
+        parts += [
+            f" N_LEVELS_USED: 2 (1st and last) |",
+            f" TRACING_ORDER:{conf['TRACING_ORDER']} |",
+            f" TRACE_SYMPTOMS: {conf['TRACE_SYMPTOMS']} |",
+            f" INTERPOLATE_USING_LOCKDOWN_CONTACTS:{conf['INTERPOLATE_CONTACTS_USING_LOCKDOWN_CONTACTS']} |",
+            f" MODIFY_BEHAVIOR: {conf['SHOULD_MODIFY_BEHAVIOR']}",
+        ]
+        return "".join(parts)
 
     if risk_model == "transformer":
-        type_of_run += f" USE_ORACLE: {conf['USE_ORACLE']}"
-        type_of_run += f" N_LEVELS_USED: {n_behavior_levels} |"
-        type_of_run += f" INTERPOLATE_USING_LOCKDOWN_CONTACTS:{conf['INTERPOLATE_CONTACTS_USING_LOCKDOWN_CONTACTS']} |"
-        type_of_run += f" REC_LEVEL_THRESHOLDS: {conf['REC_LEVEL_THRESHOLDS']} |"
-        type_of_run += f" MAX_RISK_LEVEL: {conf['MAX_RISK_LEVEL']} |"
-        type_of_run += f" MODIFY_BEHAVIOR: {conf['SHOULD_MODIFY_BEHAVIOR']} "
-        type_of_run += f"\n RISK_MAPPING: {conf['RISK_MAPPING']}"
-        return type_of_run
+        parts += [
+            f" USE_ORACLE: {conf['USE_ORACLE']}",
+            f" N_LEVELS_USED: {n_behavior_levels} |",
+            f" INTERPOLATE_USING_LOCKDOWN_CONTACTS:{conf['INTERPOLATE_CONTACTS_USING_LOCKDOWN_CONTACTS']} |",
+            f" REC_LEVEL_THRESHOLDS: {conf['REC_LEVEL_THRESHOLDS']} |",
+            f" MAX_RISK_LEVEL: {conf['MAX_RISK_LEVEL']} |",
+            f" MODIFY_BEHAVIOR: {conf['SHOULD_MODIFY_BEHAVIOR']} ",
+            f"\n RISK_MAPPING: {conf['RISK_MAPPING']}",
+        ]
+        return "".join(parts)
 
     if risk_model in ['heuristicv1', 'heuristicv2', 'heuristicv3', 'heuristicv4']:
-        type_of_run += f" N_LEVELS_USED: {n_behavior_levels} |"
-        type_of_run += f" INTERPOLATE_USING_LOCKDOWN_CONTACTS:{conf['INTERPOLATE_CONTACTS_USING_LOCKDOWN_CONTACTS']} |"
-        type_of_run += f" MAX_RISK_LEVEL: {conf['MAX_RISK_LEVEL']} |"
-        type_of_run += f" MODIFY_BEHAVIOR: {conf['SHOULD_MODIFY_BEHAVIOR']}"
-        return type_of_run
+        parts += [
+            f" N_LEVELS_USED: {n_behavior_levels} |",
+            f" INTERPOLATE_USING_LOCKDOWN_CONTACTS:{conf['INTERPOLATE_CONTACTS_USING_LOCKDOWN_CONTACTS']} |",
+            f" MAX_RISK_LEVEL: {conf['MAX_RISK_LEVEL']} |",
+            f" MODIFY_BEHAVIOR: {conf['SHOULD_MODIFY_BEHAVIOR']}",
+        ]
+        return "".join(parts)
 
     raise ValueError(f"Unknown risk model:{risk_model}")
 
@@ -99,6 +106,7 @@ class ControlledSimulation:
         # useful for queries
         self.people = None
         self.locations = None
+        self.location_index = None
 
         self._build_config()
         self._build_env(n_people=n_people,
@@ -138,11 +146,7 @@ class ControlledSimulation:
             str(time.time_ns())[-6:])
 
         if Path(self.config["outdir"]).exists():
-            out_path = Path(self.config["outdir"])
-            out_idx = 1
-            while (out_path.parent / (out_path.name + f"_{out_idx}")).exists():
-                out_idx += 1
-            self.config["outdir"] = str(out_path.parent / (out_path.name + f"_{out_idx}"))
+            self.config["outdir"] = get_next_free_outdir(self.config["outdir"])
 
         os.makedirs(self.config["outdir"])
         self.logfile = f"{self.config['outdir']}/log_{timenow}.txt"
@@ -258,9 +262,10 @@ class ControlledSimulation:
         # Initiate city process, which runs every hour
         self.env.process(self.city.run(SECONDS_PER_HOUR, outfile))
 
-        # initiate humans
+        # initiate humans (bound method hoisted out of the loop, this runs once per human)
+        register_process = self.env.process
         for human in self.city.humans:
-            self.env.process(human.run())
+            register_process(human.run())
 
         # load all locations
         self.people = PeopleManager(self.city.humans)
@@ -276,6 +281,8 @@ class ControlledSimulation:
                     + [home for home in self.city.households]
         all_places.sort(key=operator.attrgetter("name"))
         self.locations = {place.name : place for place in all_places}
+        # locations are static for the lifetime of the sim, so the name -> position lookup is built once
+        self.location_index = {name : idx for idx, name in enumerate(self.locations)}
 
         self.env.process(console_logger.run(self.env, city=self.city))
         self.end_time = self.env.ts_initial + simulation_days * SECONDS_PER_DAY
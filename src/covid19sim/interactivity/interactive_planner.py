@@ -1,5 +1,7 @@
 import bisect
 import collections.abc
+import functools
+import itertools
 import math
 import numbers
 
@@ -11,9 +13,11 @@ import numpy as np
 import warnings
 
 # loot existing functionality
-from covid19sim.utils.mobility_planner import MobilityPlanner, ACTIVITIES, Activity
+from covid19sim.utils.mobility_planner import MobilityPlanner, ACTIVITIES, Activity, \
+    _ACTIVITY_TO_LOCATION_TYPE, _ACTIVITY_DURATION_PARAMETER_KEYS, \
+    _presample_activity
 
-from covid19sim.utils.utils import _random_choice, filter_queue_max, filter_open, compute_distance, _normalize_scores, _get_seconds_since_midnight, log
+from covid19sim.utils.utils import filter_queue_max, filter_open, compute_distance, _normalize_scores, _get_seconds_since_midnight, log
 from covid19sim.utils.constants import SECONDS_PER_DAY, SECONDS_PER_HOUR, SECONDS_PER_MINUTE
 
 class InteractivePlanner(MobilityPlanner):
@@ -29,6 +33,18 @@ class InteractivePlanner(MobilityPlanner):
     def __init__(self, human, env, conf):
         super().__init__(human, env, conf)
 
+        # configuration used on every activity / invitation; it doesn't change during a run so it is read once
+        self.MAX_AGE_CHILDREN_WITHOUT_SUPERVISION = conf['MAX_AGE_CHILDREN_WITHOUT_PARENT_SUPERVISION']
+        self.P_INVITATION_ACCEPTANCE = conf['P_INVITATION_ACCEPTANCE']
+        self.MIN_SOCIAL_DURATION = min(conf['MIN_MESSAGE_PASSING_DURATION'], conf['INFECTION_DURATION'])
+        self.AVERAGE_TIME_TO_HOSPITAL_GIVEN_SYMPTOMS = conf['AVERAGE_DAYS_TO_HOSPITAL_GIVEN_SYMPTOMS'] * SECONDS_PER_DAY
+        self.AVERAGE_TIME_TO_CRITICAL_IF_HOSPITALIZED = conf['AVERAGE_DAYS_TO_CRITICAL_IF_HOSPITALIZED'] * SECONDS_PER_DAY
+        self.AVERAGE_TIME_DEATH_IF_CRITICAL = conf['AVERAGE_DAYS_DEATH_IF_CRITICAL'] * SECONDS_PER_DAY
+        self.SYMPTOMS_MOBILITY_PROFILE = _get_symptoms_mobility_profile(conf)
+        # opening and closing times used while scheduling activities whose location isn't decided yet
+        self.TYPICAL_OPEN_CLOSE_TIMES = {activity_name: _get_open_close_times(activity_name, conf)
+                                         for activity_name in _ACTIVITY_TO_LOCATION_TYPE}
+
     def __repr__(self):
         return f"<MobilityPlanner for {self.human}>"
 
@@ -59,14 +75,17 @@ class InteractivePlanner(MobilityPlanner):
         # Add an additional 1 to be on teh safe side and sample activities for an extra day.
         n_days = self.conf['simulation_days'] + 1
         todays_weekday = self.env.timestamp.weekday()
+        # bit w is set if weekday w is a working day; turns weekday membership tests into a shift and a mask
+        self._working_days_mask = sum(1 << int(day) for day in self.human.working_days)
 
-        MAX_AGE_CHILDREN_WITHOUT_SUPERVISION = self.conf['MAX_AGE_CHILDREN_WITHOUT_PARENT_SUPERVISION']
+        MAX_AGE_CHILDREN_WITHOUT_SUPERVISION = self.MAX_AGE_CHILDREN_WITHOUT_SUPERVISION
         if self.human.age <= MAX_AGE_CHILDREN_WITHOUT_SUPERVISION:
             self.follows_adult_schedule = True
             self.adults_in_house = [h for h in self.human.household.residents if
                                     h.age > MAX_AGE_CHILDREN_WITHOUT_SUPERVISION]
             if len(self.adults_in_house) > 0:
-                self.adult_to_follow_today = self.rng.choice(self.adults_in_house, size=1).item()
+                # same draw as rng.choice(adults, size=1), without converting the list to an object array
+                self.adult_to_follow_today = self.adults_in_house[self.rng.randint(len(self.adults_in_house))]
                 self.adult_to_follow_today.mobility_planner.inverted_supervision.add(self.human)
             else:
                 self.follows_adult_schedule = False
@@ -79,21 +98,26 @@ class InteractivePlanner(MobilityPlanner):
             if self.human.does_not_work:
                 does_work = np.zeros(n_days)
             else:
-                does_work = 1.0 * np.array(
-                    [(todays_weekday + i) % 7 in self.human.working_days for i in range(n_days)])
-                n_working_days = (does_work > 0).sum()
-                does_work[does_work > 0] = [_sample_activity_duration("work", self.conf, self.rng) for _ in
-                                            range(n_working_days)]
+                # all working days are known upfront, so their durations are drawn in a single call
+                weekdays = (todays_weekday + np.arange(n_days)) % 7
+                working = ((self._working_days_mask >> weekdays) & 1).astype(bool)
+                does_work = np.zeros(n_days)
+                does_work[working] = _sample_activity_durations("work", self.conf, self.rng, working.sum())
 
             ## other activities
             does_grocery = _presample_activity("grocery", self.conf, self.rng, n_days)
             does_exercise = _presample_activity("exercise", self.conf, self.rng, n_days)
             does_socialize = _presample_activity("socialize", self.conf, self.rng, n_days)
+            # drawn upfront in the same order as they would be drawn for each day in _patch_schedule
+            awake_durations, sleep_durations = _sample_awake_and_sleep_durations(self.conf, self.rng, n_days)
 
             # schedule them all while satisfying sleep constraints
             # Note: we sample locations on the day of activity
             last_activity = self.current_activity
             full_schedule = []
+            # ranges for the backing schedule are collected as days are planned; they are loaded in one go below
+            keys, activities = [], []
+            start_date = self.env.timestamp.date()
             for i in range(n_days):
                 assert last_activity.name == "sleep", f"found {last_activity} and not sleep"
 
@@ -101,7 +125,7 @@ class InteractivePlanner(MobilityPlanner):
                 # Note: duration of activities is equally important. A variance factor of 10 in the distribution
                 # might result in duration spanning two or more days which will violate the assumptions in this planner.
                 to_schedule = []
-                tentative_date = (self.env.timestamp + datetime.timedelta(days=i)).date()
+                tentative_date = start_date + datetime.timedelta(days=i)
                 to_schedule.append(
                     Activity(None, does_work[i].item(), "work", self.human.workplace, self.human, tentative_date))
                 to_schedule.append(
@@ -112,17 +136,22 @@ class InteractivePlanner(MobilityPlanner):
                     Activity(None, does_exercise[i].item(), "exercise", None, self.human, tentative_date))
 
                 # adds idle and sleep acivities too
-                schedule = _patch_schedule(self.human, last_activity, to_schedule, self.conf)
+                schedule = _patch_schedule(self.human, last_activity, to_schedule, self.conf,
+                                           max_awake_duration=awake_durations[i].item(),
+                                           sleep_duration=sleep_durations[i].item())
                 last_activity = schedule[-1]
                 full_schedule.append(schedule)
+                _collect_ranges(schedule, keys, activities, self.sleep_schedule)
                 # (debug)
                 if last_activity.duration == 0:
                     warnings.warn(
                         f"{self.human} has 0 duration {last_activity}\nschedule:{schedule}\npenultimate:{full_schedule[-2]}")
 
-            assert all(schedule[-1].name == "sleep" for schedule in
-                       full_schedule), "sleep not found as last element in a schedule"
-            assert len(full_schedule) == n_days, "not enough schedule prepared"
+            # sanity checks; like the asserts themselves, the loop is skipped with python -O
+            if __debug__:
+                for schedule in full_schedule:
+                    assert schedule[-1].name == "sleep", "sleep not found as last element in a schedule"
+                assert len(full_schedule) == n_days, "not enough schedule prepared"
 
             # fill the schedule with sleep if there is some time left at the end
             time_left_to_simulation_end = (full_schedule[-1][-1].end_time - self.env.timestamp).total_seconds()
@@ -132,23 +161,14 @@ class InteractivePlanner(MobilityPlanner):
                                                   "sleep", self.human.household, self.human,
                                                   prepend_name="filler")])
                 full_schedule.append(filler_schedule)
+                _collect_ranges(filler_schedule, keys, activities, self.sleep_schedule)
 
-            for day in full_schedule:
-                for activity in day:
-                    if activity.start_time == activity.end_time:
-                        continue
-                    if activity.name == "sleep":
-                        self.sleep_schedule.append(activity)
-                    self.backing_schedule[activity.start_time.timestamp(), activity.end_time.timestamp()] = activity
+            # the presampled schedule is loaded in one go rather than inserting (and shifting) one range at a time
+            self.backing_schedule.bulk_load(keys, activities)
 
-            # extract schedule from backing structure
-            derived_schedule = []
-            for cycle in range(len(self.sleep_schedule)):
-                if cycle == len(self.sleep_schedule)-1 or cycle == len(self.sleep_schedule):
-                    continue
-                derived_schedule.append(deque(self.get_schedule_for_day(cycle)))
-
-            self.full_schedule = deque(derived_schedule)
+            # extract schedule from backing structure; the last sleep closes the last day, so it doesn't start one
+            self.full_schedule = deque(deque(self.get_schedule_for_day(cycle))
+                                       for cycle in range(len(self.sleep_schedule) - 1))
 
     def get_schedule_for_day(self, day: int):
         """
@@ -166,12 +186,12 @@ class InteractivePlanner(MobilityPlanner):
         assert day <= len(self.sleep_schedule)-2, "Attempted to address day > simulated days"
         # first day
         if day == -1:
-            return self.backing_schedule.get_range(self.sleep_schedule[0].start_time.timestamp(), self.sleep_schedule[0].start_time.timestamp())
+            return self.backing_schedule.get_range(self.sleep_schedule[0].start_timestamp, self.sleep_schedule[0].start_timestamp)
         elif day == len(self.sleep_schedule) - 2:
-            return self.backing_schedule.get_range(self.sleep_schedule[day].end_time.timestamp())
+            return self.backing_schedule.get_range(self.sleep_schedule[day].end_timestamp)
         # case any other day
         else:
-            return self.backing_schedule.get_range(self.sleep_schedule[day].end_time.timestamp(), self.sleep_schedule[day+1].start_time.timestamp())
+            return self.backing_schedule.get_range(self.sleep_schedule[day].end_timestamp, self.sleep_schedule[day+1].start_timestamp)
 
     def get_schedule(self, for_kids=False):
         """
@@ -188,10 +208,8 @@ class InteractivePlanner(MobilityPlanner):
         if for_kids:
             assert not self.follows_adult_schedule, "kids do not have preplanned schedule"
             # on the last simulation day, at the time of this function call, adult might not have next_schedule.
-            next_schedule = []
-            if len(self.full_schedule) > 0:
-                next_schedule = list(self.full_schedule[0])
-            return [self.current_activity] + list(self.schedule_for_day) + next_schedule
+            next_schedule = self.full_schedule[0] if len(self.full_schedule) > 0 else ()
+            return [self.current_activity, *self.schedule_for_day, *next_schedule]
 
         if len(self.schedule_for_day) == 0:
             self.schedule_for_day = self._prepare_schedule()
@@ -207,13 +225,11 @@ class InteractivePlanner(MobilityPlanner):
         Args:
             activities: a list of activities that correspond to an existing scheduling block.
         """
-        time_range = self.backing_schedule.get_range(activities[0].start_time.timestamp(), activities[-1].end_time.timestamp()-1.0)
         # block delete
-        for activity in time_range:
-            del self.backing_schedule[activity.start_time.timestamp()]
+        self.backing_schedule.delete_range(activities[0].start_timestamp, activities[-1].end_timestamp-1.0)
         # insert replacement
         for activity in activities:
-            self.backing_schedule[(activity.start_time.timestamp(), activity.end_time.timestamp())] = activity
+            self.backing_schedule[(activity.start_timestamp, activity.end_timestamp)] = activity
 
     def update_schedule(self, activities: [Activity]):
         """
@@ -222,17 +238,12 @@ class InteractivePlanner(MobilityPlanner):
         assert activities[0].start_time >= self.env.timestamp, "Attempting to edit the past, but you can't change the past. You can't change the past..."
         self._update_backing_schedule(activities)
 
-        day_activity_falls_on = None
-        for index, sleep in enumerate(self.sleep_schedule):
-            if activities[0].start_time < sleep.end_time:
-                day_activity_falls_on = index - 1
-                break
+        # sleeps are immutable and sorted, so the day is found by bisecting on their end times
+        index = bisect.bisect_right(_AttributeView(self.sleep_schedule, "end_time"), activities[0].start_time)
+        day_activity_falls_on = index - 1 if index < len(self.sleep_schedule) else None
 
         if day_activity_falls_on == self.schedule_day:
-            stripped_schedule = [a for a in self.schedule_for_day if not (a.start_time >= activities[0].start_time and a.start_time < activities[-1].end_time)]
-            new_schedule = stripped_schedule + activities
-            new_schedule.sort(key=operator.attrgetter("start_time"))
-            self.schedule_for_day = deque(new_schedule)
+            self.schedule_for_day = deque(_replace_block(self.schedule_for_day, activities))
         else:
             #current day is initial
             if self.schedule_day == -1:
@@ -240,10 +251,7 @@ class InteractivePlanner(MobilityPlanner):
             #current day is after
             else:
                 awaiting_index = day_activity_falls_on - self.schedule_day - 1
-            stripped_schedule = [a for a in self.full_schedule[awaiting_index] if not (a.start_time >= activities[0].start_time and a.start_time < activities[-1].end_time)]
-            new_schedule = stripped_schedule + activities
-            new_schedule.sort(key=operator.attrgetter("start_time"))
-            self.full_schedule[awaiting_index] = deque(new_schedule)
+            self.full_schedule[awaiting_index] = deque(_replace_block(self.full_schedule[awaiting_index], activities))
 
     def get_next_activity(self):
         """
@@ -269,7 +277,7 @@ class InteractivePlanner(MobilityPlanner):
         assert activity.name == "socialize", "coordination for other activities is not implemented."
 
         # don't simulate gatherings which will not impact any message passing or transmissions
-        if activity.duration < min(self.conf['MIN_MESSAGE_PASSING_DURATION'], self.conf['INFECTION_DURATION']):
+        if activity.duration < self.MIN_SOCIAL_DURATION:
             return None
 
         group = set()
@@ -295,14 +303,15 @@ class InteractivePlanner(MobilityPlanner):
         assert activity.name == "socialize", "coordination for other activities is not implemented."
         today = self.env.timestamp.date()
 
-        current_schedule = [self.current_activity] + list(self.schedule_for_day)
+        # only the end of the current schedule matters here, so it is not copied
+        last_activity = self.schedule_for_day[-1] if len(self.schedule_for_day) > 0 else self.current_activity
         if (
                 not _can_accept_invite(today, self)
                 or (
                 # Feature NotImplmented - to Schedule an event that modifies both the current_schedule and the next_schedule
                 # ignoring the equality (in second cond. of `and`) here will make `activity` to be the last `schedule_for_day` which breaks the invariant that `last_activity` in `schedule_for_day` should be sleep.
-                activity.start_time < current_schedule[-1].end_time
-                and activity.end_time >= current_schedule[-1].end_time
+                activity.start_time < last_activity.end_time
+                and activity.end_time >= last_activity.end_time
         )
                 or (  # can't schedule an event before the current_event ends
                 activity.start_time < self.current_activity.end_time
@@ -310,15 +319,14 @@ class InteractivePlanner(MobilityPlanner):
                 or (
                 # can only modify remaining schedule (sleep) if currently human is not sleeping (not waking up early)
                 self.current_activity.name == "sleep"
-                and activity.end_time <= current_schedule[-1].end_time
+                and activity.end_time <= last_activity.end_time
         )
         ):
             return False
 
         self.invitation["received"].add(today)
 
-        P_INVITATION_ACCEPTANCE = self.conf['P_INVITATION_ACCEPTANCE']
-        if self.rng.random() < 1 - P_INVITATION_ACCEPTANCE:
+        if self.rng.random() < 1 - self.P_INVITATION_ACCEPTANCE:
             return False
 
         # invitations are sent on the day of the event
@@ -326,21 +334,19 @@ class InteractivePlanner(MobilityPlanner):
         # and leave the current schedule unchanged
 
         update_next_schedule = False
-        next_schedule = list(self.full_schedule[0])
         # find schedule such that the invitation activity ends before the schedule ends
         # that schedule needs to be updated
-        if activity.end_time <= current_schedule[-1].end_time:
+        if activity.end_time <= last_activity.end_time:
             # its a double check wrt to the above condition (kept it here for better readability)
             if self.current_activity.name == "sleep":
                 return False
             else:
                 remaining_schedule = [self.current_activity]
-                new_schedule = list(self.schedule_for_day)
+                new_schedule = self.schedule_for_day  # _modify_schedule only reads it and returns a new deque
         else:
             update_next_schedule = True
-            remaining_schedule = [self.current_activity] + list(
-                self.schedule_for_day)  # this is only [current_activity] if current_activity.name == "sleep"
-            new_schedule = list(self.full_schedule[0])
+            remaining_schedule = [self.current_activity, *self.schedule_for_day]  # this is only [current_activity] if current_activity.name == "sleep"
+            new_schedule = self.full_schedule[0]
 
         # /!\ by accepting the invite, `self` doesn't invite others to its social
         # thus, if there is a non-overlapping social on the schedule, `self` will go alone.
@@ -386,16 +392,16 @@ class InteractivePlanner(MobilityPlanner):
                 self.human.assign_household(household)
                 household.add_resident(self.human, index_case_history)
                 #
-                MAX_AGE_CHILDREN_WITHOUT_SUPERVISION = self.conf['MAX_AGE_CHILDREN_WITHOUT_PARENT_SUPERVISION']
+                MAX_AGE_CHILDREN_WITHOUT_SUPERVISION = self.MAX_AGE_CHILDREN_WITHOUT_SUPERVISION
                 self.adults_in_house = [h for h in self.human.household.residents if
                                         h.age > MAX_AGE_CHILDREN_WITHOUT_SUPERVISION]
                 adults = _can_supervise_kid(self.adults_in_house)
 
-            adult = self.rng.choice(adults, size=1).item()
+            adult = adults[self.rng.randint(len(adults))]
             adult_schedule = adult.mobility_planner.get_schedule(for_kids=True)
 
             work_activity = None
-            if not self.human.does_not_work and self.env.timestamp.weekday() in self.human.working_days:
+            if not self.human.does_not_work and (self._working_days_mask >> self.env.timestamp.weekday()) & 1:
                 work = _sample_activity_duration("work", self.conf, self.rng)
                 work_activity = Activity(None, work, "work", self.human.workplace, self.human,
                                          self.env.timestamp.date())
@@ -426,17 +432,18 @@ class InteractivePlanner(MobilityPlanner):
 
         # invite others
         if _can_send_invite(today, self):
-            todays_activities = []
-            all_activities = [self.current_activity] + list(self.schedule_for_day)
-            all_activities += [] if len(self.full_schedule) == 0 else list(self.full_schedule[0])
-            for activity in all_activities:
-                if activity.start_time.day == today.day or activity.end_time.day == today.day:
-                    todays_activities.append(activity)
-
-            MIN_DURATION = min(self.conf['INFECTION_DURATION'], self.conf['MIN_MESSAGE_PASSING_DURATION'])
-            socials = [x for x in todays_activities if x.name == "socialize"]
+            # only socials are of interest, so the (cheap) name check comes before the date checks
+            next_schedule = self.full_schedule[0] if len(self.full_schedule) > 0 else ()
+            socials = [
+                activity for activity in itertools.chain((self.current_activity,), self.schedule_for_day, next_schedule)
+                if activity.name == "socialize"
+                and (activity.start_time.day == today.day or activity.end_time.day == today.day)
+            ]
             assert len(socials) <= 1, "more than one socials on one day are not allowed in preplanned scheduling"
-            if socials and socials[0].duration >= MIN_DURATION:
+            if not socials:
+                return
+
+            if socials[0].duration >= self.MIN_SOCIAL_DURATION:
                 self.invitation["sent"].add(today)
                 self.invite(socials[0], self.human.known_connections)
 
@@ -461,16 +468,19 @@ class InteractivePlanner(MobilityPlanner):
         #
         self.human.intervened_behavior.quarantine.reset_if_its_time()
 
+        # `env.timestamp` builds a new datetime on every access, and time doesn't move during this call
+        now = self.env.timestamp
+        in_hospital = self.hospitalization_timestamp is not None or self.critical_condition_timestamp is not None
+
         # (a) set back to normal routine if self.human was hospitalized
         # (b) if human is still recovering in hospital then return the activity as it is because these were determined at the time when hospitalization occured
         # Note 1: after recovery from hospitalization, infection_timestamp will always be None
         # Note 2: hospitalization_recovery_timestamp will take into account hospitalization recovery due to critical condition
         # Note 3: patient dies in hospital so while recovering it is necessary to check for `human_will_die_if_critical`
         if (
-                (self.hospitalization_timestamp is not None
-                 or self.critical_condition_timestamp is not None)
+                in_hospital
                 and not self.human_will_die_if_critical
-                and self.env.timestamp >= self.hospitalization_recovery_timestamp
+                and now >= self.hospitalization_recovery_timestamp
         ):
             self.hospitalization_timestamp = None
             self.critical_condition_timestamp = None
@@ -479,15 +489,14 @@ class InteractivePlanner(MobilityPlanner):
             # assert self.human.infection_timestamp is None, f"{self.human} is out of hospital and still has COVID"
 
         elif (
-                (self.hospitalization_timestamp is not None
-                 or self.critical_condition_timestamp is not None)
-                and self.env.timestamp < self.hospitalization_recovery_timestamp
+                in_hospital
+                and now < self.hospitalization_recovery_timestamp
         ):
             return activity  # while in hospital, these activities are predetermined until hospitalization recovery time
 
-        AVERAGE_TIME_TO_HOSPITAL_GIVEN_SYMPTOMS = self.conf['AVERAGE_DAYS_TO_HOSPITAL_GIVEN_SYMPTOMS']
-        AVERAGE_TIME_TO_CRITICAL_IF_HOSPITALIZED = self.conf['AVERAGE_DAYS_TO_CRITICAL_IF_HOSPITALIZED']
-        AVERAGE_TIME_DEATH_IF_CRITICAL = self.conf['AVERAGE_DAYS_DEATH_IF_CRITICAL']
+        AVERAGE_TIME_TO_HOSPITAL_GIVEN_SYMPTOMS = self.AVERAGE_TIME_TO_HOSPITAL_GIVEN_SYMPTOMS
+        AVERAGE_TIME_TO_CRITICAL_IF_HOSPITALIZED = self.AVERAGE_TIME_TO_CRITICAL_IF_HOSPITALIZED
+        AVERAGE_TIME_DEATH_IF_CRITICAL = self.AVERAGE_TIME_DEATH_IF_CRITICAL
 
         # hospitalization related checks
         # Note: because of the wide variance we have used averages only
@@ -499,10 +508,10 @@ class InteractivePlanner(MobilityPlanner):
                 and self.human.covid_symptom_start_time is not None
                 and self.hospitalization_timestamp is None
                 and (
-                self.env.timestamp - self.human.covid_symptom_start_time).total_seconds() >= AVERAGE_TIME_TO_HOSPITAL_GIVEN_SYMPTOMS * SECONDS_PER_DAY
+                now - self.human.covid_symptom_start_time).total_seconds() >= AVERAGE_TIME_TO_HOSPITAL_GIVEN_SYMPTOMS
         ):
             self.human.city.tracker.track_hospitalization(self.human)  # track
-            self.hospitalization_timestamp = self.env.timestamp
+            self.hospitalization_timestamp = now
             hospital = _select_location(self.human, "hospital", self.human.city, self.rng, self.conf)
             if hospital is None:
                 self, human, activity = _human_dies(self, self.human, activity, self.env)
@@ -522,10 +531,10 @@ class InteractivePlanner(MobilityPlanner):
                 and self.hospitalization_timestamp is not None
                 and self.critical_condition_timestamp is None
                 and (
-                self.env.timestamp - self.hospitalization_timestamp).total_seconds() >= AVERAGE_TIME_TO_CRITICAL_IF_HOSPITALIZED * SECONDS_PER_DAY
+                now - self.hospitalization_timestamp).total_seconds() >= AVERAGE_TIME_TO_CRITICAL_IF_HOSPITALIZED
         ):
             self.human.city.tracker.track_hospitalization(self.human, "icu")  # track
-            self.critical_condition_timestamp = self.env.timestamp
+            self.critical_condition_timestamp = now
             ICU = _select_location(self.human, "hospital-icu", self.human.city, self.rng, self.conf)
             if ICU is None:
                 self, human, activity = _human_dies(self, self.human, activity, self.env)
@@ -545,7 +554,7 @@ class InteractivePlanner(MobilityPlanner):
                 and self.critical_condition_timestamp is not None
                 and self.death_timestamp is None
                 and (
-                self.env.timestamp - self.critical_condition_timestamp).total_seconds() >= AVERAGE_TIME_DEATH_IF_CRITICAL * SECONDS_PER_DAY
+                now - self.critical_condition_timestamp).total_seconds() >= AVERAGE_TIME_DEATH_IF_CRITICAL
         ):
             self, human, activity = _human_dies(self, self.human, activity, self.env)
             print(self.human, "is dead because of the critical condition", activity)
@@ -555,12 +564,13 @@ class InteractivePlanner(MobilityPlanner):
         # /!\ It doesn't let a single adult attend to two kids: one in hospital and another in house or 3 kids: in different hospitals etc..
         for kid in self.inverted_supervision:
             assert not self.follows_adult_schedule, "a kid should not go into inverted supervision"
+            kid_planner = kid.mobility_planner
             if (
-                    kid.mobility_planner.location_of_hospitalization is not None
-                    or kid.mobility_planner.hospitalization_timestamp is not None
-                    or kid.mobility_planner.critical_condition_timestamp is not None
+                    kid_planner.location_of_hospitalization is not None
+                    or kid_planner.hospitalization_timestamp is not None
+                    or kid_planner.critical_condition_timestamp is not None
             ):
-                location = kid.mobility_planner.location_of_hospitalization  # in hospitalization, kid's activities have location
+                location = kid_planner.location_of_hospitalization  # in hospitalization, kid's activities have location
                 reason = "inverted-supervision-hospitalization"
                 activity.cancel_and_go_to_location(reason=reason,
                                                    location=location)  # Note: this activity can't be supervised
@@ -577,7 +587,7 @@ class InteractivePlanner(MobilityPlanner):
             # if activity is already at home - no need to update
             # /!\ if for some reason, this condition is not valid while the kid's activity was canceled due to sickness
             # then this activity will call refresh_location and raise AssertionError due to prepend_name
-            kid_to_stay_at_home = kid.mobility_planner.human_to_rest_at_home
+            kid_to_stay_at_home = kid_planner.human_to_rest_at_home
             if (
                     kid_to_stay_at_home
                     and activity.location is not None
@@ -631,7 +641,9 @@ class InteractivePlanner(MobilityPlanner):
             self.human_to_rest_at_home = False
             return self.human_to_rest_at_home
 
-        self.human_to_rest_at_home = self.rng.random() < 1 - _get_likelihood_to_go_out(self.human, self.conf)
+        # healthy humans (the common case) always go out, so there is nothing to draw for them
+        likelihood_to_go_out = _get_likelihood_to_go_out(self.human, self.SYMPTOMS_MOBILITY_PROFILE)
+        self.human_to_rest_at_home = likelihood_to_go_out < 1.0 and self.rng.random() < 1 - likelihood_to_go_out
         return self.human_to_rest_at_home
 
     def _intervention_related_behavior_changes(self, activity):
@@ -660,10 +672,62 @@ class InteractivePlanner(MobilityPlanner):
         """
         self.schedule_for_day = []
         self.current_activity = None
-        while len(self.full_schedule) > 0:
-            schedule = self.full_schedule.popleft()
-            while len(schedule) > 0:
-                activity = schedule.popleft()
+        # each day's deque is emptied too, as popping every activity off it did before
+        for schedule in self.full_schedule:
+            schedule.clear()
+        self.full_schedule.clear()
+
+class _AttributeView(object):
+    """
+    Read-only sequence of `attribute` of each object in `items`, so that a list sorted by that attribute can be
+    searched with `bisect` without keeping a parallel list in sync.
+    """
+
+    def __init__(self, items, attribute):
+        self._items = items
+        self._get = operator.attrgetter(attribute)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return self._get(self._items[index])
+
+def _replace_block(schedule, activities):
+    """
+    Replaces the activities of `schedule` that start within the block covered by `activities`.
+
+    Args:
+        schedule (deque): `Activity`s arranged in increasing order of their starting time
+        activities (list): contiguous `Activity`s arranged in increasing order of their starting time
+
+    Returns:
+        (list): `Activity`s arranged in increasing order of their starting time
+    """
+    schedule = list(schedule)
+    # `schedule` is sorted, so the activities starting within the block form one contiguous slice
+    start_times = _AttributeView(schedule, "start_time")
+    lower = bisect.bisect_left(start_times, activities[0].start_time)
+    upper = bisect.bisect_left(start_times, activities[-1].end_time, lo=lower)
+    return schedule[:lower] + list(activities) + schedule[upper:]
+
+def _collect_ranges(schedule, keys, activities, sleep_schedule):
+    """
+    Appends the non-empty `Activity`s of `schedule` and their ranges to `activities` and `keys`, and its sleeps to `sleep_schedule`.
+
+    Args:
+        schedule (deque): `Activity`s arranged in increasing order of their starting time
+        keys (list): (start, end) timestamps of the collected activities
+        activities (list): collected activities
+        sleep_schedule (list): collected sleep activities
+    """
+    for activity in schedule:
+        if activity.start_time == activity.end_time:
+            continue
+        if activity.name == "sleep":
+            sleep_schedule.append(activity)
+        keys.append((activity.start_timestamp, activity.end_timestamp))
+        activities.append(activity)
 
 def _move_relevant_activities_to_hospital(human, mobility_planner, current_activity, rng, conf, hospital,
                                           critical=False):
@@ -694,28 +758,24 @@ def _move_relevant_activities_to_hospital(human, mobility_planner, current_activ
 
     acitivities_to_revert_back_to_normal = []  # if critical, change in recovery time will need previously modified activities to change back to normal
     activities_to_modify = []
-    for activity in [current_activity] + list(mobility_planner.schedule_for_day):
+    for activity in itertools.chain((current_activity,), mobility_planner.schedule_for_day):
         if activity.end_time < recovery_time:
             activities_to_modify.append(activity)
 
     for schedule in mobility_planner.full_schedule:
-        for activity in schedule:
-            if (
-                    activity.start_time > recovery_time
-                    and "Hospitalized" in activity.append_name
-            ):
-                acitivities_to_revert_back_to_normal.append(activity)
-
-            elif (
-                    activity.start_time > recovery_time
-                    and "Hospitalized" not in activity.append_name
-            ):
+        # activities of a day are sorted by start time, so the ones starting until `recovery_time` are a prefix
+        n_until_recovery = bisect.bisect_right(_AttributeView(schedule, "start_time"), recovery_time)
+        activities_to_modify.extend(itertools.islice(schedule, n_until_recovery))
+        # after recovery, only the run of activities that were modified by an earlier hospitalization is reverted
+        for activity in itertools.islice(schedule, n_until_recovery, None):
+            if "Hospitalized" not in activity.append_name:
                 break
 
+            acitivities_to_revert_back_to_normal.append(activity)
             activities_to_modify.append(activity)
 
+    reason = "Hospitalized" if not critical else "ICU"
     for activity in activities_to_modify:
-        reason = "Hospitalized" if not critical else "ICU"
         activity.cancel_and_go_to_location(reason=reason, location=hospital)
 
     for activity in acitivities_to_revert_back_to_normal:
@@ -726,12 +786,35 @@ def _move_relevant_activities_to_hospital(human, mobility_planner, current_activ
 
     return current_activity, mobility_planner
 
-def _get_likelihood_to_go_out(human, conf):
+def _get_symptoms_mobility_profile(conf):
+    """
+    Collects the symptom lists and the likelihood to go out given each of them from the configuration file.
+
+    Args:
+        conf (dict): yaml configuration of the experiment
+
+    Returns:
+        symptom_severity (tuple): (symptom name, severity rank) pairs; 1 is mild, 2 is moderate and 3 is severe
+        likelihood_to_go_out (tuple): likelihood to go out indexed by severity rank (0 is no listed symptom)
+        Both are hashable so that the profile can key a cache.
+    """
+    # a symptom listed at several severities gets the highest of them, as later pairs override earlier ones in a dict
+    symptom_severity = tuple((symptom, severity)
+                             for severity, key in enumerate(["MILD_SYMPTOMS", "MODERATE_SYMPTOMS", "SEVERE_SYMPTOMS"], start=1)
+                             for symptom in conf[key])
+    likelihood_to_go_out = (1.0,
+                            conf['P_MOBILE_GIVEN_MILD_SYMPTOMS'],
+                            conf['P_MOBILE_GIVEN_MODERATE_SYMPTOMS'],
+                            conf['P_MOBILE_GIVEN_SEVERE_SYMPTOMS'])
+    return symptom_severity, likelihood_to_go_out
+
+def _get_likelihood_to_go_out(human, mobility_profile):
     """
     Checks for human's condition and recommends the likelhihood to go out
 
     Args:
         human (covid19sim.human.Human): `human` for whom mobility reduction is to be checked
+        mobility_profile (tuple): output of `_get_symptoms_mobility_profile`
 
     Returns:
         (float): likelihood to go out of home
@@ -740,29 +823,27 @@ def _get_likelihood_to_go_out(human, conf):
     if len(current_symptoms) == 0:
         return 1.0
 
-    ## reduction due to symtpoms
-    # 1.
-    SEVERE_SYMPTOMS = conf['SEVERE_SYMPTOMS']
-    P_MOBILE_GIVEN_SEVERE_SYMPTOMS = conf['P_MOBILE_GIVEN_SEVERE_SYMPTOMS']
-
-    if any(symptom in SEVERE_SYMPTOMS for symptom in current_symptoms):
-        return P_MOBILE_GIVEN_SEVERE_SYMPTOMS
+    # only the set of symptoms matters, and the same few sets are shared by most of the sick population
+    return _get_likelihood_to_go_out_given_symptoms(frozenset(current_symptoms), mobility_profile)
 
-    # 2.
-    MODERATE_SYMPTOMS = conf['MODERATE_SYMPTOMS']
-    P_MOBILE_GIVEN_MODERATE_SYMPTOMS = conf['P_MOBILE_GIVEN_MODERATE_SYMPTOMS']
-
-    if any(symptom in MODERATE_SYMPTOMS for symptom in current_symptoms):
-        return P_MOBILE_GIVEN_MODERATE_SYMPTOMS
-
-    # 3.
-    MILD_SYMPTOMS = conf['MILD_SYMPTOMS']
-    P_MOBILE_GIVEN_MILD_SYMPTOMS = conf['P_MOBILE_GIVEN_MILD_SYMPTOMS']
+@functools.lru_cache(maxsize=1024)
+def _get_likelihood_to_go_out_given_symptoms(current_symptoms, mobility_profile):
+    """
+    Recommends the likelihood to go out given the most severe of `current_symptoms`.
 
-    if any(symptom in MILD_SYMPTOMS for symptom in current_symptoms):
-        return P_MOBILE_GIVEN_MILD_SYMPTOMS
+    Args:
+        current_symptoms (frozenset): symptoms experienced by `human`
+        mobility_profile (tuple): output of `_get_symptoms_mobility_profile`
 
-    return 1.0
+    Returns:
+        (float): likelihood to go out of home
+    """
+    ## reduction due to symtpoms
+    # one lookup per symptom instead of scanning every severity list; `Symptom`s match configuration entries by name
+    symptom_severity, likelihood_to_go_out = mobility_profile
+    symptom_severity = dict(symptom_severity)
+    severity = max((symptom_severity.get(str(symptom), 0) for symptom in current_symptoms), default=0)
+    return likelihood_to_go_out[severity]
 
 def _modify_schedule(human, remaining_schedule, new_activity, new_schedule):
     """
@@ -783,71 +864,62 @@ def _modify_schedule(human, remaining_schedule, new_activity, new_schedule):
 
     valid = True
     last_activity = remaining_schedule[-1]
+    # times of `new_activity` don't change here, so they are read once
+    new_start_time, new_end_time = new_activity.start_time, new_activity.end_time
+    last_end_time = last_activity.end_time
     # if new_activity completely overlaps with last_activity, do not accept
-    if new_activity.end_time <= last_activity.end_time:
+    if new_end_time <= last_end_time:
         valid = False
 
     # if new_activity starts before the last_activity, do not accept
-    if new_activity.start_time < last_activity.end_time:
+    if new_start_time < last_end_time:
         valid = False
 
     # if new_activity coincides with work in new_schedule, do not accept
-    work_activity = [(idx, x) for idx, x in enumerate(new_schedule) if x.name == "work"]
-    work_activity_idx = -1
-    if work_activity:
-        work_activity_idx = work_activity[0][0]
-        if (work_activity[0][1].start_time <= new_activity.start_time
-                and new_activity.end_time < work_activity[0][1].end_time):
+    # only the first work activity matters, so the scan stops there
+    work_activity_idx, work_activity = next(((idx, x) for idx, x in enumerate(new_schedule) if x.name == "work"), (-1, None))
+    if work_activity is not None:
+        if (work_activity.start_time <= new_start_time
+                and new_end_time < work_activity.end_time):
             valid = False
 
     if not valid:
         return deque([]), False
 
-    partial_schedule = []
     other_activities = [x for idx, x in enumerate(new_schedule) if idx >= work_activity_idx]
 
     # fit the new_activity into the schedule
     # - = activity, . = new_activity
-    for activity in other_activities:
-        cut_right, cut_left = False, False
-
-        if activity.start_time <= new_activity.start_time:
-
-            if activity.end_time <= new_activity.start_time:
-                partial_schedule.append(activity)
-                continue
-
-            # --.--... ==> --.... (cut right)
-            cut_right = True
-            if activity.end_time > new_activity.end_time:
-                # ...--.-- ==> .....--- (cut left also)
-                cut_left = True
-
-        if activity.start_time >= new_activity.start_time:
-            if activity.end_time <= new_activity.end_time:
-                # discard, but if both ends are equal, add new_activity before discarding or there will be a gap
-                if new_activity not in partial_schedule:
-                    partial_schedule.append(new_activity)
-                continue
-
-            if new_activity.end_time <= activity.start_time:
-                partial_schedule.append(activity)
-                continue
-
-            # ...--.-- ==> .....--- (cut left only)
-            cut_left = True
-
-        if cut_right:
+    # activities are contiguous and sorted, so the ones ending by the time new_activity starts are a prefix (kept as is),
+    # the ones ending by the time it ends are replaced by it, and only the one in progress at each end is cut.
+    end_times = _AttributeView(other_activities, "end_time")
+    lower = bisect.bisect_right(end_times, new_start_time)
+    upper = bisect.bisect_right(end_times, new_end_time, lo=lower)
+    if upper < len(other_activities) and other_activities[upper].start_time < new_end_time:
+        upper += 1
+    partial_schedule = other_activities[:lower]
+    new_activity_added = False  # `new_activity` goes in exactly once; a flag avoids scanning `partial_schedule` for it
+    for activity in other_activities[lower:upper]:
+        start_time, end_time = activity.start_time, activity.end_time
+
+        # --.--... ==> --.... (cut right)
+        # an activity starting together with new_activity is discarded, unless it also has to be cut left
+        if start_time < new_start_time or (start_time == new_start_time and end_time > new_end_time):
             partial_schedule.append(
                 activity.align(new_activity, cut_left=False, prepend_name="modified-cut-right", new_owner=human))
 
-        if new_activity not in partial_schedule:
+        # activities that lie within new_activity are discarded; new_activity goes in their place
+        if not new_activity_added:
             partial_schedule.append(new_activity)
+            new_activity_added = True
 
-        if cut_left:
+        # ...--.-- ==> .....--- (cut left)
+        if end_time > new_end_time:
             partial_schedule.append(
                 activity.align(new_activity, cut_left=True, prepend_name="modified-cut-left", new_owner=human))
 
+    partial_schedule += other_activities[upper:]
+
     full_schedule = [x for idx, x in enumerate(new_schedule) if idx < work_activity_idx and x.duration > 0]
     full_schedule += [x for x in partial_schedule if x.duration > 0 or x.name == "sleep"]
 
@@ -855,10 +927,11 @@ def _modify_schedule(human, remaining_schedule, new_activity, new_schedule):
     assert full_schedule[
                -1].name == "sleep", f"sleep not found as the last activity. \nfull_schedule:\n{full_schedule}\nnew_schedule:{new_schedule}\nremaining_schedule:{remaining_schedule}"
 
-    # comment for rigorous checks or use -O as an option to run python scripts to avoid checking for assertions
-    for a1, a2 in zip(full_schedule, full_schedule[1:]):
-        assert a1.end_time == a2.start_time, "times do not align"
-        assert a1.duration >= 0, "negative duration encountered"
+    # comment for rigorous checks or use -O as an option to run python scripts to avoid checking for assertions (and the loop)
+    if __debug__:
+        for a1, a2 in zip(full_schedule, itertools.islice(full_schedule, 1, None)):
+            assert a1.end_time == a2.start_time, "times do not align"
+            assert a1.duration >= 0, "negative duration encountered"
 
     return deque(full_schedule), True
 
@@ -887,14 +960,15 @@ def _patch_kid_schedule(human, adult_schedule, work_activity, current_activity,
     assert any(activity.start_time > last_activity.end_time for activity in
                adult_schedule), "at least one adult activity that ends after kid's current activity is expected"
 
-    max_awake_duration = _sample_activity_duration("awake", conf, human.rng)
-    schedule, awake_duration = [], 0
+    mobility_planner, rng = human.mobility_planner, human.rng
+    max_awake_duration = _sample_activity_duration("awake", conf, rng)
+    schedule, awake_duration = deque(), 0
     # add work just after the current_activity on the remaining_schedule
     if (
             work_activity is not None
-            and human.mobility_planner.hospitalization_timestamp is None
-            and human.mobility_planner.critical_condition_timestamp is None
-            and human.mobility_planner.death_timestamp is None
+            and mobility_planner.hospitalization_timestamp is None
+            and mobility_planner.critical_condition_timestamp is None
+            and mobility_planner.death_timestamp is None
     ):
         work_activity.start_time = _get_datetime_for_seconds_since_midnight(human.work_start_time,
                                                                             work_activity.tentative_date)
@@ -907,18 +981,21 @@ def _patch_kid_schedule(human, adult_schedule, work_activity, current_activity,
         schedule, last_activity, awake_duration = _add_to_the_schedule(human, schedule, work_activity,
                                                                        last_activity, awake_duration)
 
-    candidate_activities = [activity for activity in adult_schedule if activity.end_time > last_activity.end_time]
+    last_end_time = last_activity.end_time
+    candidate_activities = [activity for activity in adult_schedule if activity.end_time > last_end_time]
     # 1. discard activities which are completely a subset of schedule upto now
     # 2. align the activity which has a partial overlap with current_activity
     # 3. add rest of them as it is
     for activity in candidate_activities:
+        # both ends are read once per iteration
+        last_end_time, end_time = last_activity.end_time, activity.end_time
 
         # 1.
-        if activity.end_time <= last_activity.end_time:
+        if end_time <= last_end_time:
             continue
 
         # 2.
-        elif activity.start_time < last_activity.end_time < activity.end_time:
+        elif activity.start_time < last_end_time < end_time:
             new_activity = activity.align(last_activity, cut_left=True, prepend_name="supervised", new_owner=human)
 
         # 3.
@@ -935,22 +1012,24 @@ def _patch_kid_schedule(human, adult_schedule, work_activity, current_activity,
 
     # finally, close the schedule by adding sleep
     schedule, last_activity, awake_duration = _add_sleep_to_schedule(human, schedule, last_sleep_activity,
-                                                                     last_activity, human.rng, conf, awake_duration,
+                                                                     last_activity, rng, conf, awake_duration,
                                                                      max_awake_duration=max_awake_duration)
 
     # if kid is hospitalized, all the activities should take place at the hospital
-    if human.mobility_planner.location_of_hospitalization is not None:
+    location_of_hospitalization = mobility_planner.location_of_hospitalization
+    if location_of_hospitalization is not None:
         for activity in schedule:
-            activity.location = human.mobility_planner.location_of_hospitalization
+            activity.location = location_of_hospitalization
             activity._add_to_append_name("-patched-hospitalized")
 
-    full_schedule = [current_activity] + schedule
-    for a1, a2 in zip(full_schedule, full_schedule[1:]):
-        assert a1.end_time == a2.start_time, "times do not align"
+    # like the asserts themselves, the loop is skipped with python -O
+    if __debug__:
+        for a1, a2 in zip(itertools.chain((current_activity,), schedule), schedule):
+            assert a1.end_time == a2.start_time, "times do not align"
 
-    return deque(schedule)
+    return schedule
 
-def _patch_schedule(human, last_activity, activities, conf):
+def _patch_schedule(human, last_activity, activities, conf, max_awake_duration=0, sleep_duration=None):
     """
     Makes a continuous schedule out of the list of `activities` in continuation to `last_activity` (expects "sleep") from previous schedule.
 
@@ -959,6 +1038,8 @@ def _patch_schedule(human, last_activity, activities, conf):
         last_activity (Activity): last activity (expects sleep) that `human` was doing
         activities (list): list of `Activity`s to add to the schedule
         conf (dict): yaml configuration of the experiment
+        max_awake_duration (float): time in seconds for which `human` stays awake. Sampled if not positive.
+        sleep_duration (float): time in seconds for which `human` sleeps at the end of the schedule. Sampled if None.
 
     Returns:
         schedule (deque): a deque of `Activity`s where the activities are arranged in increasing order of their starting time.
@@ -966,13 +1047,14 @@ def _patch_schedule(human, last_activity, activities, conf):
     assert last_activity.name == "sleep", "sleep not found as the last activity"
 
     current_activity = last_activity
-    schedule, awake_duration = [], 0
+    work_start_time = human.work_start_time
+    schedule, awake_duration = deque(), 0
     for activity in activities:
         if activity.duration == 0:
             continue
 
         if activity.name == "work":
-            activity.start_time = _get_datetime_for_seconds_since_midnight(human.work_start_time,
+            activity.start_time = _get_datetime_for_seconds_since_midnight(work_start_time,
                                                                            activity.tentative_date)
             # adjust activities if there is a conflict
             if activity.start_time < current_activity.end_time:
@@ -989,9 +1071,11 @@ def _patch_schedule(human, last_activity, activities, conf):
     # finally, close the schedule by adding sleep
     schedule, current_activity, awake_duration = _add_sleep_to_schedule(human, schedule, last_activity,
                                                                         current_activity, human.rng, conf,
-                                                                        awake_duration)
+                                                                        awake_duration,
+                                                                        max_awake_duration=max_awake_duration,
+                                                                        sleep_duration=sleep_duration)
 
-    return deque(schedule)
+    return schedule
 
 def _add_to_the_schedule(human, schedule, activity, last_activity, awake_duration):
     """
@@ -999,24 +1083,30 @@ def _add_to_the_schedule(human, schedule, activity, last_activity, awake_duratio
 
     Args:
         human (covid19sim.human.Human): human for which `activity` needs to be added to the schedule
-        schedule (list): list of `Activity`s
+        schedule (deque): deque of `Activity`s
         activity (Activity): new `activity` that needs to be added to the `schedule`
         last_activity (Activity): last activity that `human` was doing
         awake_duration (float): total amount of time in seconds that `human` had been awake
 
     Returns:
-        schedule (list): list of `Activity`s with the last `Activity` as sleep
+        schedule (deque): deque of `Activity`s with the last `Activity` as sleep
         last_activity (Activity): sleep as the last activity
         awake_duration (float): total amount of time in seconds that `human` has been awake after adding the new `activity`.
 
     """
+    # end_time is derived from start_time and duration on every access, so it is computed once here
+    last_end_time = last_activity.end_time
     assert activity.start_time is not None, "only fully defined activities are expected"
-    assert activity.start_time >= last_activity.end_time, "function assumes no confilict with the last activity"
+    assert activity.start_time >= last_end_time, "function assumes no confilict with the last activity"
 
     # ** A ** # set up the activity so that it is in accordance to the previous activity and the location's opening and closing constraints
 
     # opening and closing time for the location of this activity
-    opening_time, closing_time = _get_open_close_times(activity.name, human.conf, activity.location)
+    typical_open_close_times = human.mobility_planner.TYPICAL_OPEN_CLOSE_TIMES
+    if activity.location is None and activity.name in typical_open_close_times:
+        opening_time, closing_time = typical_open_close_times[activity.name]
+    else:
+        opening_time, closing_time = _get_open_close_times(activity.name, human.conf, activity.location)
 
     ## check the constraints with respect to a location
     seconds_since_midnight = _get_seconds_since_midnight(activity.start_time)
@@ -1025,7 +1115,7 @@ def _add_to_the_schedule(human, schedule, activity, last_activity, awake_duratio
 
     if seconds_since_midnight < opening_time:
         activity.start_time = _get_datetime_for_seconds_since_midnight(opening_time, activity.tentative_date)
-        if activity.start_time < last_activity.end_time:
+        if activity.start_time < last_end_time:
             return schedule, last_activity, awake_duration
 
     # if it is not an all time open location, end_in_seconds can not exceed closing time
@@ -1038,7 +1128,7 @@ def _add_to_the_schedule(human, schedule, activity, last_activity, awake_duratio
     assert activity.duration >= 0, f"negative duration {activity.duration} encountered"
 
     # ** B ** # Add an idle activity if there is a time gap between this activity and the last activity
-    idle_time = (activity.start_time - last_activity.end_time).total_seconds()
+    idle_time = (activity.start_time - last_end_time).total_seconds()
 
     assert idle_time >= 0, f"negative idle_time {idle_time} encountered"
 
@@ -1052,29 +1142,32 @@ def _add_to_the_schedule(human, schedule, activity, last_activity, awake_duratio
     return schedule, activity, awake_duration + activity.duration
 
 def _add_sleep_to_schedule(human, schedule, last_sleep_activity, last_activity, rng, conf, awake_duration,
-                           max_awake_duration=0):
+                           max_awake_duration=0, sleep_duration=None):
     """
     Adds sleep `Activity` to the schedule. We constrain everyone to have an awake duration during which they
     hop from one network to the other, and a sleep during which they are constrained to be at their respective household networks.
 
     Args:
         human (covid19sim.human.Human): human for which sleep schedule needs to be added.
-        schedule (list): list of `Activity`s
+        schedule (deque): deque of `Activity`s
         wake_up_time_in_seconds (float): seconds since midnight when `human` wake up
         last_activity (Activity): last activity that `human` was doing
         rng (np.random.RandomState): Random number generator
         conf (dict): yaml configuration of the experiment
         awake_duration (float): total amount of time in seconds that `human` had been awake
+        max_awake_duration (float): time in seconds for which `human` stays awake. Sampled if not positive.
+        sleep_duration (float): time in seconds for which `human` sleeps. Sampled if None.
 
     Returns:
-        schedule (list): list of `Activity`s with the last `Activity` as sleep
+        schedule (deque): deque of `Activity`s with the last `Activity` as sleep
         last_activity (Activity): sleep as the last activity
         total_duration (float): total amount of time in seconds that `human` had spent across all the activities in the schedule.
     """
     # draw time for which `self` remains awake and sleeps
     if max_awake_duration <= 0:
         max_awake_duration = _sample_activity_duration("awake", conf, rng)
-    sleep_duration = _sample_activity_duration("sleep", conf, rng)
+    if sleep_duration is None:
+        sleep_duration = _sample_activity_duration("sleep", conf, rng)
 
     start_time = last_sleep_activity.end_time + datetime.timedelta(seconds=max_awake_duration)
     sleep_activity = Activity(start_time, sleep_duration, "sleep", human.household, human)
@@ -1101,33 +1194,21 @@ def _make_hard_changes_to_activity_for_scheduling(next_activity, last_activity,
         last_activity (Activity): activity in alignment with `next_activity`
     """
 
-    def _assert_positive_duration(next_activity, last_activity):
-        assert next_activity.duration >= 0 and last_activity.duration >= 0, "negative duration encountered"
-        return next_activity, last_activity
-
     # print(f"making hard changes between next- {next_activity} and last - {last_activity}")
     # 1. if last activity can be safely cut short, do that and leave next_activity unchanged
     if not keep_last_unchanged and last_activity.start_time <= next_activity.start_time:
         last_activity.duration = (next_activity.start_time - last_activity.start_time).total_seconds()
-        return _assert_positive_duration(next_activity, last_activity)
-
-    # 2. else cut short next_activity
-    # short version -
-    # next_activity.start_time = last_activity.end_time
-    # next_activity.duration = min(0, (next_activity.end_time - next_activity.start_time).total_seconds())
-    # return next_activity, last_activity
-
-    # more explicit
-    # 2a. do next_activity late
-    if next_activity.end_time >= last_activity.end_time:
-        next_activity.start_time = last_activity.end_time
-        next_activity.duration = (next_activity.end_time - next_activity.start_time).total_seconds()
-        return _assert_positive_duration(next_activity, last_activity)
-
-    # 2b. next_activity was supposed to end before the last activity, hence don't do next_activity
-    next_activity.start_time = last_activity.end_time
-    next_activity.duration = 0
-    return _assert_positive_duration(next_activity, last_activity)
+
+    # 2. else do next_activity late, i.e. starting when last_activity ends, for the same duration.
+    # if next_activity was supposed to end before the last activity, it is not done at all (zero duration).
+    else:
+        last_end_time = last_activity.end_time
+        if next_activity.end_time < last_end_time:
+            next_activity.duration = 0
+        next_activity.start_time = last_end_time
+
+    assert next_activity.duration >= 0 and last_activity.duration >= 0, "negative duration encountered"
+    return next_activity, last_activity
 
 def _add_idle_activity(human, schedule, next_activity, last_activity, awake_duration):
     """
@@ -1135,22 +1216,23 @@ def _add_idle_activity(human, schedule, next_activity, last_activity, awake_dura
 
     Args:
         human (covid19sim.human.Human): human for which "idle" activity needs to be added to the schedule
-        schedule (list): list of `Activity`s
+        schedule (deque): deque of `Activity`s
         next_activity (Activity): new `activity` that needs to be added to the `schedule`
         last_activity (Activity): last activity that `human` was doing
         awake_duration (float): total amount of time in seconds that `human` had been awake
 
     Returns:
-        schedule (list): list of `Activity`s with the last `Activity` as sleep
+        schedule (deque): deque of `Activity`s with the last `Activity` as sleep
         last_activity (Activity): sleep as the last activity
         awake_duration (float): total amount of time in seconds that `human` has been awake after adding the new `activity`.
     """
-    duration = (next_activity.start_time - last_activity.end_time).total_seconds()
+    last_end_time = last_activity.end_time
+    duration = (next_activity.start_time - last_end_time).total_seconds()
     if duration == 0:
         return schedule, last_activity, awake_duration
 
     assert duration > 0, "negative duration for idle activity is not allowed"
-    idle_activity = Activity(last_activity.end_time, duration, "idle", human.household, human)
+    idle_activity = Activity(last_end_time, duration, "idle", human.household, human)
 
     idle_time = (idle_activity.end_time - next_activity.start_time).total_seconds()
     assert idle_time == 0, "non-zero idle time after adding idle_activity"
@@ -1174,15 +1256,8 @@ def _get_open_close_times(activity_name, conf, location=None):
     if location is not None:
         return location.opening_time, location.closing_time
 
-    elif activity_name == "grocery":
-        location_type = "STORE"
-    elif activity_name == "socialize":
-        location_type = "MISC"
-    elif activity_name == "exercise":
-        location_type = "PARK"
-    elif activity_name in ["sleep", "idle"]:
-        location_type = "HOUSEHOLD"
-    else:
+    location_type = _ACTIVITY_TO_LOCATION_TYPE.get(activity_name)
+    if location_type is None:
         raise ValueError(f"Unknown activity_name:{activity_name}")
 
     # # /!\ same calculation is in covid19sim.locations.location.Location.__init__()
@@ -1192,111 +1267,87 @@ def _get_open_close_times(activity_name, conf, location=None):
 
     return opening_time, closing_time
 
-def _sample_days_to_next_activity(P_ACTIVITY_DAYS, rng):
+def _get_activity_duration_parameters(activity, conf):
     """
-    Samples days after which next activity can be scheduled.
+    Fetches parameters of the distribution of the duration of `activity` from the configuration file.
 
     Args:
-        P_ACTIVITY_DAYS (list): each element is a list - [d, p], where
-                d is number of days after which this activity can be scheduled
-                p is the probability of sampling d days for this activity.
-                Note: p is normalized before being used.
-        rng (np.random.RandomState): Random number generator
+        activity (str): type of activity
+        conf (dict): yaml configuration of the experiment
 
     Returns:
-        (float): Number of days after which next activity can be scheduled
+        AVERAGE_TIME (float): average duration of `activity` (hours)
+        SCALE_FACTOR (float): scale of the gamma distribution
+        MAX_TIME (float): maximum duration of `activity` (hours)
     """
-    p = np.array([x[1] for x in P_ACTIVITY_DAYS])
-    sampled_day = _random_choice(P_ACTIVITY_DAYS, size=1, P=p / p.sum(), rng=rng)[0]
-    return sampled_day[0]
+    if activity not in _ACTIVITY_DURATION_PARAMETER_KEYS:
+        raise ValueError(f"Unknown activity:{activity}")
+    AVERAGE_TIME_KEY, SCALE_FACTOR_KEY, MAX_TIME_KEY = _ACTIVITY_DURATION_PARAMETER_KEYS[activity]
 
-def _presample_activity(type_of_activity, conf, rng, n_days):
+    return conf[AVERAGE_TIME_KEY], conf[SCALE_FACTOR_KEY], conf[MAX_TIME_KEY]
+
+def _sample_activity_duration(activity, conf, rng):
     """
-    Presamples activity for `n_days`.
+    Samples duration for `activity` according to predefined distribution, parameters of which are defined in the configuration file.
+    TODO - Make it age dependent.
 
     Args:
-        P_ACTIVITY_DAYS (list): each element is a list - [d, p], where
-                d is number of days after which this activity can be scheduled
-                p is the probability of sampling d days for this activity.
-                Note: p is normalized before being used.
+        activity (str): type of activity
+        conf (dict): yaml configuration of the experiment
         rng (np.random.RandomState): Random number generator
-        n_days (int): number of days to sample for
 
     Returns:
-        (np.array): An array of size `n_days` containing float, where x implies do that activity for x seconds
+        (float): duration for which to conduct activity (seconds)
     """
-    if type_of_activity == "grocery":
-        P_ACTIVITY_DAYS = conf['P_GROCERY_SHOPPING_DAYS']
-    elif type_of_activity == "socialize":
-        P_ACTIVITY_DAYS = conf['P_SOCIALIZE_DAYS']
-    elif type_of_activity == "exercise":
-        P_ACTIVITY_DAYS = conf['P_EXERCISE_DAYS']
-    else:
-        raise ValueError
-
-    total_days_sampled = 0
-    does_activity = np.zeros(n_days)
-    duration = np.zeros(n_days)
-    while total_days_sampled <= n_days:
-        days = _sample_days_to_next_activity(P_ACTIVITY_DAYS, rng)
-        total_days_sampled += days
-        if total_days_sampled >= n_days:
-            break
-        does_activity[days] = _sample_activity_duration(type_of_activity, conf, rng)
+    SECONDS_CONVERSION_FACTOR = SECONDS_PER_HOUR
+    AVERAGE_TIME, SCALE_FACTOR, MAX_TIME = _get_activity_duration_parameters(activity, conf)
 
-    return does_activity
+    # round off to prevent microseconds in timestamps
+    duration = math.floor(rng.gamma(AVERAGE_TIME / SCALE_FACTOR, SCALE_FACTOR) * SECONDS_CONVERSION_FACTOR)
+    return min(duration, MAX_TIME * SECONDS_PER_HOUR)
 
-def _sample_activity_duration(activity, conf, rng):
+def _sample_activity_durations(activity, conf, rng, size):
     """
-    Samples duration for `activity` according to predefined distribution, parameters of which are defined in the configuration file.
-    TODO - Make it age dependent.
+    Vectorized version of `_sample_activity_duration`. Draws the same sequence of durations as `size` consecutive calls to it.
 
     Args:
         activity (str): type of activity
         conf (dict): yaml configuration of the experiment
         rng (np.random.RandomState): Random number generator
+        size (int): number of durations to sample
 
     Returns:
-        (float): duration for which to conduct activity (seconds)
+        (np.array): An array of size `size` containing durations for which to conduct activity (seconds)
     """
     SECONDS_CONVERSION_FACTOR = SECONDS_PER_HOUR
+    AVERAGE_TIME, SCALE_FACTOR, MAX_TIME = _get_activity_duration_parameters(activity, conf)
 
-    if activity == "work":
-        AVERAGE_TIME = conf["AVERAGE_TIME_SPENT_WORK"]
-        SCALE_FACTOR = conf['TIME_SPENT_SCALE_FACTOR_FOR_WORK']
-        MAX_TIME = conf['MAX_TIME_WORK']
-
-    elif activity == "grocery":
-        AVERAGE_TIME = conf["AVERAGE_TIME_SPENT_GROCERY"]
-        SCALE_FACTOR = conf['TIME_SPENT_SCALE_FACTOR_FOR_SHORT_ACTIVITIES']
-        MAX_TIME = conf["MAX_TIME_SHORT_ACTVITIES"]
-
-    elif activity == "exercise":
-        AVERAGE_TIME = conf['AVERAGE_TIME_SPENT_EXERCISING']
-        SCALE_FACTOR = conf['TIME_SPENT_SCALE_FACTOR_FOR_SHORT_ACTIVITIES']
-        MAX_TIME = conf["MAX_TIME_SHORT_ACTVITIES"]
-
-    elif activity == "socialize":
-        AVERAGE_TIME = conf['AVERAGE_TIME_SPENT_SOCIALIZING']
-        SCALE_FACTOR = conf['TIME_SPENT_SCALE_FACTOR_FOR_SHORT_ACTIVITIES']
-        MAX_TIME = conf["MAX_TIME_SHORT_ACTVITIES"]
+    # round off to prevent microseconds in timestamps
+    durations = np.floor(rng.gamma(AVERAGE_TIME / SCALE_FACTOR, SCALE_FACTOR, size=size) * SECONDS_CONVERSION_FACTOR)
+    return np.minimum(durations, MAX_TIME * SECONDS_PER_HOUR)
 
-    elif activity == "sleep":
-        AVERAGE_TIME = conf['AVERAGE_TIME_SLEEPING']
-        SCALE_FACTOR = conf['TIME_SPENT_SCALE_FACTOR_SLEEP_AWAKE']
-        MAX_TIME = conf['MAX_TIME_SLEEP']
+def _sample_awake_and_sleep_durations(conf, rng, size):
+    """
+    Vectorized version of sampling "awake" and then "sleep" durations with `_sample_activity_duration` on each of `size` days.
+    Both are drawn in a single call with interleaved parameters, so the sequence of durations is the same.
 
-    elif activity == "awake":
-        AVERAGE_TIME = conf['AVERAGE_TIME_AWAKE']
-        SCALE_FACTOR = conf['TIME_SPENT_SCALE_FACTOR_SLEEP_AWAKE']
-        MAX_TIME = conf['MAX_TIME_AWAKE']
+    Args:
+        conf (dict): yaml configuration of the experiment
+        rng (np.random.RandomState): Random number generator
+        size (int): number of days to sample durations for
 
-    else:
-        raise ValueError
+    Returns:
+        awake_durations (np.array): An array of size `size` containing durations for which to stay awake (seconds)
+        sleep_durations (np.array): An array of size `size` containing durations for which to sleep (seconds)
+    """
+    SECONDS_CONVERSION_FACTOR = SECONDS_PER_HOUR
+    AVERAGE_TIME, SCALE_FACTOR, MAX_TIME = np.array([_get_activity_duration_parameters(activity, conf)
+                                                     for activity in ["awake", "sleep"]], dtype=np.float64).T
 
     # round off to prevent microseconds in timestamps
-    duration = math.floor(rng.gamma(AVERAGE_TIME / SCALE_FACTOR, SCALE_FACTOR) * SECONDS_CONVERSION_FACTOR)
-    return min(duration, MAX_TIME * SECONDS_PER_HOUR)
+    durations = np.floor(rng.gamma(np.tile(AVERAGE_TIME / SCALE_FACTOR, size), np.tile(SCALE_FACTOR, size)) * SECONDS_CONVERSION_FACTOR)
+    durations = np.minimum(durations.reshape(size, 2), MAX_TIME * SECONDS_PER_HOUR)
+    return durations[:, 0], durations[:, 1]
 
 def _select_location(human, activity, city, rng, conf):
     """
@@ -1351,7 +1402,9 @@ def _select_location(human, activity, city, rng, conf):
 
         S = human.visits.n_miscs
         candidate_locs = city.miscs
-        pool_pref = [(compute_distance(human.location, m) + 1e-1) ** -1 for m in candidate_locs]
+        # same as compute_distance(human.location, m) for every misc m, in one pass over their coordinates
+        lat, lon = city.miscs_coordinates.T
+        pool_pref = (np.sqrt((human.location.lat - lat) ** 2 + (human.location.lon - lon) ** 2) + 1e-1) ** -1
 
         # Only consider locations open for business and not too long queues
         locs = filter_queue_max(filter_open(candidate_locs), conf.get("MAX_MISC_QUEUE_LENGTH"))
@@ -1465,22 +1518,26 @@ def _can_supervise_kid(adults):
     Returns:
         (list): list of filtered adults who can take a kid for supervision
     """
-    valid_adults = []
+    valid_adults, alive_adults = [], []
     for adult in adults:
+        mobility_planner = adult.mobility_planner
+
+        assert not mobility_planner.follows_adult_schedule, "invlaid adult to consider for supervision"
 
-        assert not adult.mobility_planner.follows_adult_schedule, "invlaid adult to consider for supervision"
+        if mobility_planner.death_timestamp is not None:
+            continue
 
+        alive_adults.append(adult)
         if (
-                not adult.mobility_planner.human_to_rest_at_home
-                and adult.mobility_planner.hospitalization_timestamp is None
-                and adult.mobility_planner.death_timestamp is None
-                and adult.mobility_planner.critical_condition_timestamp is None
+                not mobility_planner.human_to_rest_at_home
+                and mobility_planner.hospitalization_timestamp is None
+                and mobility_planner.critical_condition_timestamp is None
         ):
             valid_adults.append(adult)
 
     # if there is no option, then the kid has to stay with someone
     if len(valid_adults) == 0:
-        return [adult for adult in adults if adult.mobility_planner.death_timestamp is None]
+        return alive_adults
 
     return valid_adults
 
@@ -1532,114 +1589,115 @@ def _reallocate_residence(human, households, rng, conf):
 # =================
 # ranged dict class
 # =================
-def _binary_key_search(LUT, key):
+def _binary_key_search(starts, ends, key):
     """
-    binary search through the LUT, assumes forward LUT.
+    binary search for the range containing `key`; assumes `starts` is sorted and that the ranges do not overlap.
     """
-    Lower = 0
-    Upper = len(LUT)
-    while Lower <= Upper:
-        i = math.floor((Lower + Upper) / 2)  # get middle index
-        if i == len(LUT):
-            break
-        if LUT[i][1] <= key:
-            Lower = i + 1
-        elif LUT[i][0] > key:
-            Upper = i - 1
-        elif LUT[i][0] <= key < LUT[i][1]:
-            return i
-    raise RangDictKeyException("Key not found")
+    i = bisect.bisect_right(starts, key) - 1
+    if i < 0 or key >= ends[i]:
+        raise RangDictKeyException("Key not found")
+    return i
 
 
 class RangeDict(collections.abc.MutableMapping):
     """
     This datastructure takes a minimum and max as a key, and maps it to a given value.
+    Ranges can't overlap, so an interval tree degenerates to flat arrays sorted by start: a point lookup is one bisect
+    over the starts plus a comparison against the matching end.
     """
 
     def __init__(self, *args, **kwargs):
-        self._store = dict()
-        self._FLUT = []  # key (start, end)
-        self._BLUT = []  # key (end, start); used purely to double check that the given addition is valid, inherent override rejection.
+        self._starts = []  # sorted start of every range
+        self._ends = []  # end of the range at the same index
+        self._values = []  # value of the range at the same index
         self.update(dict(*args, **kwargs))
 
     def __getitem__(self, key: numbers.Number or (numbers.Number, numbers.Number)):
-        # grab the nearest range. I this should be O(log n) or O(1) depending on the key used
-        if key is tuple and key in self._store:
-            return self._store[key]
-
-        i = _binary_key_search(self._FLUT, key)
-        bounds = self._FLUT[i]
-        # test that we are in range.
-        return self._store[self._FLUT[i]]
+        # a range is addressed by any point it contains, including its start
+        if isinstance(key, tuple):
+            key = key[0]
+        return self._values[_binary_key_search(self._starts, self._ends, key)]
 
     def __setitem__(self, key: (numbers.Number, numbers.Number), value):
-        # (O(n)) insert step, I wish it were faster, but to get fast lookup takes time.
-        self._check_range(key)
-        bisect.insort_left(self._FLUT, (key[0], key[1]))
-        bisect.insort_left(self._BLUT, (key[1], key[0]))
-        self._store[key] = value
+        i = self._check_range(key)
+        self._starts.insert(i, key[0])
+        self._ends.insert(i, key[1])
+        self._values.insert(i, value)
 
     def __delitem__(self, key: numbers.Number or (numbers.Number, numbers.Number)):
         # if we are given a tuple of an object to set, then grab the start time.
-        if key is tuple:
+        if isinstance(key, tuple):
             key = key[0]
-        # again, time complexity O(n), the random access really hurts us here.
-        i = _binary_key_search(self._FLUT, key)
-        del self._store[self._FLUT[i]]
-        del self._FLUT[i]
-        del self._BLUT[i]
+        i = _binary_key_search(self._starts, self._ends, key)
+        del self._starts[i]
+        del self._ends[i]
+        del self._values[i]
 
     def __iter__(self):
-        return iter(self._store)
+        return zip(self._starts, self._ends)
 
     def __len__(self):
-        return len(self._store)
+        return len(self._values)
 
     def _check_range(self, key: (numbers.Number, numbers.Number)):
         '''
-        attempt to assign the key, can fail if range is of bad format, or if overlaps with an existing range
+        attempt to assign the key, can fail if range is of bad format, or if overlaps with an existing range.
+        returns the index at which the range is to be inserted.
         '''
         if key[0] >= key[1]:
             raise RangDictKeyException("Range is not valid, should be (min, max); must be different")
 
-        # forward check
-        i_f = bisect.bisect_left(self._FLUT, (key[0], key[0]))
-        i_b = bisect.bisect_left(self._BLUT, (key[1], key[1]))
-        # test that we have empty lookup tables (initializing table)
-        if not self._FLUT and not self._BLUT:
-            return
-        # test that the relative indices match (should work for all LUT size > 0)
-        if i_f == i_b:
-            # case: at the start
-            if i_f == 0 and self._FLUT[i_f][0] < key[1]:
-                raise RangDictKeyException(
-                    "Range is not unique (ending of new block impinges upon existing start of a block).")
-            # case: at the end
-            elif i_f == len(self._FLUT) and self._FLUT[-1][1] > key[0]:
+        i = bisect.bisect_left(self._starts, key[0])
+        if i > 0 and self._ends[i - 1] > key[0]:
+            raise RangDictKeyException("Range is not unique (start of new block is within the previous block).")
+        if i < len(self._starts) and self._starts[i] < key[1]:
+            raise RangDictKeyException(
+                "Range is not unique (ending of new block impinges upon existing start of a block).")
+        return i
+
+    def bulk_load(self, keys, values):
+        '''
+        inserts many ranges at once; they are sorted and checked for overlaps in a single pass. Nothing is inserted
+        if any of them is invalid.
+        '''
+        items = sorted(itertools.chain(zip(self, self._values), zip(keys, values)), key=lambda item: item[0][0])
+        starts, ends, ordered_values = [], [], []
+        for (start, end), value in items:
+            if start >= end:
+                raise RangDictKeyException("Range is not valid, should be (min, max); must be different")
+            if ends and ends[-1] > start:
                 raise RangDictKeyException("Range is not unique (start of new block is within the previous block).")
-            # case: at the middle
-            elif (i_f != len(self._FLUT) and i_f != 0) and (
-                    self._FLUT[i_f - 1][1] > key[0] or self._FLUT[i_f][0] < key[1]):
-                raise RangDictKeyException("Range is not unique (block is contained in different block).")
-            # all tests passed.
-            else:
-                return
-        raise RangDictKeyException("LUT index mismatch (should remain in sync).")
+            starts.append(start)
+            ends.append(end)
+            ordered_values.append(value)
+        self._starts, self._ends, self._values = starts, ends, ordered_values
 
-    def get_range(self, start: numbers.Number, end: numbers.Number = None):
+    def _get_slice(self, start: numbers.Number, end: numbers.Number = None):
         try:
-            start_index = _binary_key_search(self._FLUT, start)
-            end_index = None
-            if end != None:
-                try:
-                    end_index = _binary_key_search(self._FLUT, end) + 1
-                except RangDictKeyException:
-                    pass
-            keys = [k for k in self._FLUT[start_index:end_index]]
-            return [self._store[k] for k in keys]
+            start_index = _binary_key_search(self._starts, self._ends, start)
         except RangDictKeyException:
-            return []
+            return slice(0, 0)
 
+        # an `end` that falls outside of every range leaves the slice open-ended
+        end_index = None
+        if end is not None:
+            try:
+                end_index = _binary_key_search(self._starts, self._ends, end) + 1
+            except RangDictKeyException:
+                pass
+        return slice(start_index, end_index)
+
+    def get_range(self, start: numbers.Number, end: numbers.Number = None):
+        return self._values[self._get_slice(start, end)]
+
+    def delete_range(self, start: numbers.Number, end: numbers.Number = None):
+        '''
+        deletes every range that `get_range` would return for the same arguments, in one step.
+        '''
+        selection = self._get_slice(start, end)
+        del self._starts[selection]
+        del self._ends[selection]
+        del self._values[selection]
 
 
 class RangDictKeyException(Exception):
@@ -39,7 +39,7 @@ def in_past(env: Environment, activity: Activity):
     Returns:
         True if the activity has already happened. False if it hasn't.
     """
-    return activity.end_time.timestamp() < env.timestamp.timestamp()
+    return activity.end_timestamp < env.timestamp.timestamp()
 
 
 def in_present(env: Environment, activity: Activity):
@@ -51,7 +51,7 @@ def in_present(env: Environment, activity: Activity):
     Returns:
         False if this is not the current activity, True if it is the current activity
     """
-    return activity.start_time.timestamp() < env.timestamp.timestamp() < activity.end_time.timestamp()
+    return activity.start_timestamp < env.timestamp.timestamp() < activity.end_timestamp
 
 
 def is_sleep(activity: Activity):
@@ -105,7 +105,7 @@ def get_current_day_schedule(human: Human):
 
 def get_editable_range(human: Human, activity: Activity):
     prior = human.mobility_planner.backing_schedule[(activity.start_time-timedelta(seconds=1.0)).timestamp()]
-    following = human.mobility_planner.backing_schedule[activity.end_time.timestamp()]
+    following = human.mobility_planner.backing_schedule[activity.end_timestamp]
     earliest_edit = prior.start_time if prior.name == "idle" else activity.start_time
     latest_edit = following.end_time if following.name == "idle" else activity.end_time
     return earliest_edit, latest_edit
@@ -156,7 +156,7 @@ def adjust_start_time(human: Human, activity: Activity, new_start_time: datetime
 
     # case 1: start_time is pushed back.
     if activity.start_time < new_start_time:
-        preceeding_activity = human.mobility_planner.backing_schedule.get_range(activity.start_time.timestamp()-1.0, activity.end_time.timestamp())[0]
+        preceeding_activity = human.mobility_planner.backing_schedule.get_range(activity.start_timestamp-1.0, activity.end_timestamp)[0]
         edits = []
 
         if preceeding_activity.name == "idle" and preceeding_activity != human.mobility_planner.current_activity:
@@ -175,7 +175,7 @@ def adjust_start_time(human: Human, activity: Activity, new_start_time: datetime
 
     # case 2: start_time is pushed forward.
     else:
-        coverage = human.mobility_planner.backing_schedule.get_range(new_start_time.timestamp(), activity.end_time.timestamp())
+        coverage = human.mobility_planner.backing_schedule.get_range(new_start_time.timestamp(), activity.end_timestamp)
         act_index = None
         for index, item in enumerate(coverage):
             if item == activity:
@@ -209,7 +209,7 @@ def adjust_end_time(human: Human, activity: Activity, new_end_time: datetime):
 
     # case 1: end_time is pushed backwards.
     if activity.end_time < new_end_time:
-        following_activity = human.mobility_planner.backing_schedule.get_range(activity.start_time.timestamp(), activity.end_time.timestamp())[-1]
+        following_activity = human.mobility_planner.backing_schedule.get_range(activity.start_timestamp, activity.end_timestamp)[-1]
         edits = []
 
 
@@ -233,7 +233,7 @@ def adjust_end_time(human: Human, activity: Activity, new_end_time: datetime):
 
     # case 2: end_time is pushed forward.
     else:
-        following_activity = human.mobility_planner.backing_schedule.get_range(activity.end_time.timestamp(), activity.end_time.timestamp()+1.0)[-1]
+        following_activity = human.mobility_planner.backing_schedule.get_range(activity.end_timestamp, activity.end_timestamp+1.0)[-1]
         edits = []
         if following_activity.name == "idle":
             activity = activity
@@ -263,8 +263,8 @@ def delete_activity(human: Human, activity: Activity):
     temporary_end = activity.end_time
 
     # see if we need to merge idle time.
-    previous_activity = human.mobility_planner.backing_schedule[activity.start_time.timestamp()-1.0]
-    next_activity = human.mobility_planner.backing_schedule[activity.end_time.timestamp()]
+    previous_activity = human.mobility_planner.backing_schedule[activity.start_timestamp-1.0]
+    next_activity = human.mobility_planner.backing_schedule[activity.end_timestamp]
 
     if previous_activity != human.mobility_planner.current_activity and previous_activity.name == "idle":
         temporary_start = previous_activity.start_time
@@ -277,7 +277,7 @@ def delete_activity(human: Human, activity: Activity):
 
 def insert_activity(human: Human, activity: Activity):
     # test that we are accessing only idle time.
-    existing_schedule = human.mobility_planner.backing_schedule.get_range(activity.start_time.timestamp(), activity.end_time.timestamp()-1.0)
+    existing_schedule = human.mobility_planner.backing_schedule.get_range(activity.start_timestamp, activity.end_timestamp-1.0)
     for item in existing_schedule:
         if item.name != "idle":
             return False, "Trying to write into non-idle time."
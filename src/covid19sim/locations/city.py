@@ -445,6 +445,8 @@ class City:
         for h in self.humans:
             h.stores_preferences = [(compute_distance(h.household, s) + 1e-1) ** -1 for s in self.stores]
             h.parks_preferences = [(compute_distance(h.household, s) + 1e-1) ** -1 for s in self.parks]
+        # preference for a misc depends on where the human is when socializing, so only the coordinates are stored here
+        self.miscs_coordinates = np.array([(m.lat, m.lon) for m in self.miscs], dtype=np.float64).reshape(-1, 2)
 
     def run(self, duration, outfile):
         """
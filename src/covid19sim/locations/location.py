@@ -86,8 +86,9 @@ class Location(simpy.Resource):
         self.conf = conf
         self.name = name
         self.rng = np.random.RandomState(rng.randint(2 ** 16))
-        self.lat = lat
-        self.lon = lon
+        # coordinates are sampled as numpy integers; store plain floats once so readers never have to convert
+        self.lat = float(lat)
+        self.lon = float(lon)
         self.area = area
         self.location_type = location_type
         self.env = env
@@ -11,7 +11,6 @@ from collections import Counter, defaultdict
 from copy import deepcopy
 from runstats import Statistics
 
-import dill
 import networkx as nx
 import numpy as np
 import pandas as pd
@@ -1926,5 +1925,6 @@ class Tracker(object):
             humans_data['incubation_days'] = human.incubation_days
             humans_data['recovery_days'] = human.recovery_days
             data['humans'][human.name] = humans_data
+        import dill  # only needed for this dump, keep it off the import path
         with open(outfile, 'wb') as f:
             dill.dump(data, f)
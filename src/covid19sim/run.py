@@ -20,7 +20,8 @@ from covid19sim.utils.env import Env
 from covid19sim.utils.constants import SECONDS_PER_DAY, SECONDS_PER_HOUR
 from covid19sim.log.console_logger import ConsoleLogger
 from covid19sim.inference.server_utils import DataCollectionServer
-from covid19sim.utils.utils import dump_conf, dump_tracker_data, extract_tracker_data, parse_configuration, log
+from covid19sim.utils.utils import dump_conf, dump_tracker_data, extract_tracker_data, parse_configuration, log, \
+    get_next_free_outdir
 
 def _get_intervention_string(conf):
     """
@@ -48,31 +49,37 @@ def _get_intervention_string(conf):
     risk_model = conf['RISK_MODEL']
     n_behavior_levels = conf['N_BEHAVIOR_LEVELS']
     hhld_behavior = conf['MAKE_HOUSEHOLD_BEHAVE_SAME_AS_MAX_RISK_RESIDENT']
-    type_of_run = f"{risk_model} | HHLD_BEHAVIOR_SAME_AS_MAX_RISK_RESIDENT: {hhld_behavior} | N_BEHAVIOR_LEVELS:{n_behavior_levels} |"
+    parts = [f"{risk_model} | HHLD_BEHAVIOR_SAME_AS_MAX_RISK_RESIDENT: {hhld_behavior} | N_BEHAVIOR_LEVELS:{n_behavior_levels} |"]
     if risk_model == "digital":
-        type_of_run += f" N_LEVELS_USED: 2 (1st and last) |"
-        type_of_run += f" TRACING_ORDER:{conf['TRACING_ORDER']} |"
-        type_of_run += f" TRACE_SYMPTOMS: {conf['TRACE_SYMPTOMS']} |"
-        type_of_run += f" INTERPOLATE_USING_LOCKDOWN_CONTACTS:{conf['INTERPOLATE_CONTACTS_USING_LOCKDOWN_CONTACTS']} |"
-        type_of_run += f" MODIFY_BEHAVIOR: {conf['SHOULD_MODIFY_BEHAVIOR']}"
-        return type_of_run
+        parts += [
+            f" N_LEVELS_USED: 2 (1st and last) |",
+            f" TRACING_ORDER:{conf['TRACING_ORDER']} |",
+            f" TRACE_SYMPTOMS: {conf['TRACE_SYMPTOMS']} |",
+            f" INTERPOLATE_USING_LOCKDOWN_CONTACTS:{conf['INTERPOLATE_CONTACTS_USING_LOCKDOWN_CONTACTS']} |",
+            f" MODIFY_BEHAVIOR: {conf['SHOULD_MODIFY_BEHAVIOR']}",
+        ]
+        return "".join(parts)
 
     if risk_model == "transformer":
-        type_of_run += f" USE_ORACLE: {conf['USE_ORACLE']}"
-        type_of_run += f" N_LEVELS_USED: {n_behavior_levels} |"
-        type_of_run += f" INTERPOLATE_USING_LOCKDOWN_CONTACTS:{conf['INTERPOLATE_CONTACTS_USING_LOCKDOWN_CONTACTS']} |"
-        type_of_run += f" REC_LEVEL_THRESHOLDS: {conf['REC_LEVEL_THRESHOLDS']} |"
-        type_of_run += f" MAX_RISK_LEVEL: {conf['MAX_RISK_LEVEL']} |"
-        type_of_run += f" MODIFY_BEHAVIOR: {conf['SHOULD_MODIFY_BEHAVIOR']} "
-        type_of_run += f"\n RISK_MAPPING: {conf['RISK_MAPPING']}"
-        return type_of_run
+        parts += [
+            f" USE_ORACLE: {conf['USE_ORACLE']}",
+            f" N_LEVELS_USED: {n_behavior_levels} |",
+            f" INTERPOLATE_USING_LOCKDOWN_CONTACTS:{conf['INTERPOLATE_CONTACTS_USING_LOCKDOWN_CONTACTS']} |",
+            f" REC_LEVEL_THRESHOLDS: {conf['REC_LEVEL_THRESHOLDS']} |",
+            f" MAX_RISK_LEVEL: {conf['MAX_RISK_LEVEL']} |",
+            f" MODIFY_BEHAVIOR: {conf['SHOULD_MODIFY_BEHAVIOR']} ",
+            f"\n RISK_MAPPING: {conf['RISK_MAPPING']}",
+        ]
+        return "".join(parts)
 
     if risk_model in ['heuristicv1', 'heuristicv2', 'heuristicv3', 'heuristicv4']:
-        type_of_run += f" N_LEVELS_USED: {n_behavior_levels} |"
-        type_of_run += f" INTERPOLATE_USING_LOCKDOWN_CONTACTS:{conf['INTERPOLATE_CONTACTS_USING_LOCKDOWN_CONTACTS']} |"
-        type_of_run += f" MAX_RISK_LEVEL: {conf['MAX_RISK_LEVEL']} |"
-        type_of_run += f" MODIFY_BEHAVIOR: {conf['SHOULD_MODIFY_BEHAVIOR']}"
-        return type_of_run
+        parts += [
+            f" N_LEVELS_USED: {n_behavior_levels} |",
+            f" INTERPOLATE_USING_LOCKDOWN_CONTACTS:{conf['INTERPOLATE_CONTACTS_USING_LOCKDOWN_CONTACTS']} |",
+            f" MAX_RISK_LEVEL: {conf['MAX_RISK_LEVEL']} |",
+            f" MODIFY_BEHAVIOR: {conf['SHOULD_MODIFY_BEHAVIOR']}",
+        ]
+        return "".join(parts)
 
     raise ValueError(f"Unknown risk model:{risk_model}")
 
@@ -112,11 +119,7 @@ def main(conf: DictConfig):
     )
 
     if Path(conf["outdir"]).exists():
-        out_path = Path(conf["outdir"])
-        out_idx = 1
-        while (out_path.parent / (out_path.name + f"_{out_idx}")).exists():
-            out_idx += 1
-        conf["outdir"] = str(out_path.parent / (out_path.name + f"_{out_idx}"))
+        conf["outdir"] = get_next_free_outdir(conf["outdir"])
 
     os.makedirs(conf["outdir"])
     logfile = f"{conf['outdir']}/log_{timenow}.txt"
@@ -5,17 +5,50 @@ Second, _patch_kid_schedule, which takes a current_activity and future schedule
 Third, _modify_schedule, which takes a current a schedule and a new activity that needs to be added and makes adjustment to it accordingly.
 """
 import datetime
+import functools
 import math
 import warnings
 import numpy as np
 from copy import deepcopy
 from collections import defaultdict, deque
 
-from covid19sim.utils.utils import _random_choice, filter_queue_max, filter_open, compute_distance, _normalize_scores, _get_seconds_since_midnight, log
+from covid19sim.utils.utils import filter_queue_max, filter_open, compute_distance, _normalize_scores, _get_seconds_since_midnight, log
 from covid19sim.utils.constants import SECONDS_PER_DAY, SECONDS_PER_HOUR, SECONDS_PER_MINUTE
 ACTIVITIES = ["work", "socialize", "exercise", "grocery"]
 
+# type of a typical location where an activity takes place
+_ACTIVITY_TO_LOCATION_TYPE = {
+    "grocery": "STORE",
+    "socialize": "MISC",
+    "exercise": "PARK",
+    "sleep": "HOUSEHOLD",
+    "idle": "HOUSEHOLD",
+}
+
+# configuration keys of the (average time, scale factor, max time) of the duration of each activity
+_ACTIVITY_DURATION_PARAMETER_KEYS = {
+    "work": ("AVERAGE_TIME_SPENT_WORK", "TIME_SPENT_SCALE_FACTOR_FOR_WORK", "MAX_TIME_WORK"),
+    "grocery": ("AVERAGE_TIME_SPENT_GROCERY", "TIME_SPENT_SCALE_FACTOR_FOR_SHORT_ACTIVITIES", "MAX_TIME_SHORT_ACTVITIES"),
+    "exercise": ("AVERAGE_TIME_SPENT_EXERCISING", "TIME_SPENT_SCALE_FACTOR_FOR_SHORT_ACTIVITIES", "MAX_TIME_SHORT_ACTVITIES"),
+    "socialize": ("AVERAGE_TIME_SPENT_SOCIALIZING", "TIME_SPENT_SCALE_FACTOR_FOR_SHORT_ACTIVITIES", "MAX_TIME_SHORT_ACTVITIES"),
+    "sleep": ("AVERAGE_TIME_SLEEPING", "TIME_SPENT_SCALE_FACTOR_SLEEP_AWAKE", "MAX_TIME_SLEEP"),
+    "awake": ("AVERAGE_TIME_AWAKE", "TIME_SPENT_SCALE_FACTOR_SLEEP_AWAKE", "MAX_TIME_AWAKE"),
+}
+
+# configuration key of the distribution of days between two occurrences of each presampled activity
+_P_ACTIVITY_DAYS_KEYS = {
+    "grocery": "P_GROCERY_SHOPPING_DAYS",
+    "socialize": "P_SOCIALIZE_DAYS",
+    "exercise": "P_EXERCISE_DAYS",
+}
+
 class Activity(object):
+    # every human holds a schedule of these for the whole simulation; slots drop the per-instance __dict__
+    __slots__ = ("start_time", "duration", "name", "location", "tentative_date", "prepend_name", "append_name",
+                 "is_cancelled", "owner", "rsvp", "parent_activity_pointer", "human_dies",
+                 "_end_time", "_end_time_start", "_end_time_duration",
+                 "_start_timestamp", "_start_timestamp_key", "_end_timestamp", "_end_timestamp_key")
+
     def __init__(self, start_time, duration, name, location, owner, tentative_date=None, prepend_name="", append_name=""):
         self.start_time = start_time # (datetime.datetime) object to be initialized in _patch_schedule
         self.duration = duration # (float) in seconds
@@ -33,10 +66,38 @@ class Activity(object):
 
         self.human_dies = False # to identify if this activity marks the end of human
 
+        # cached end time along with the start_time and duration it was computed for
+        self._end_time, self._end_time_start, self._end_time_duration = None, None, None
+
+        # cached POSIX timestamps along with the start_time / end_time they were computed for
+        self._start_timestamp, self._start_timestamp_key = None, None
+        self._end_timestamp, self._end_timestamp_key = None, None
+
     @property
     def end_time(self):
         assert self.start_time is not None, "start time has not been initialized"
-        return self.start_time + datetime.timedelta(seconds=self.duration) # (datetime.datetime) object to be initialized in _patch_schedule
+        # (datetime.datetime) object to be initialized in _patch_schedule, recomputed only when `start_time` or `duration` change
+        if self._end_time_start is not self.start_time or self._end_time_duration != self.duration:
+            self._end_time = self.start_time + datetime.timedelta(seconds=self.duration)
+            self._end_time_start, self._end_time_duration = self.start_time, self.duration
+        return self._end_time
+
+    @property
+    def start_timestamp(self):
+        # (float) `start_time.timestamp()`, recomputed only when `start_time` is reassigned
+        if self._start_timestamp_key is not self.start_time:
+            self._start_timestamp = self.start_time.timestamp()
+            self._start_timestamp_key = self.start_time
+        return self._start_timestamp
+
+    @property
+    def end_timestamp(self):
+        # (float) `end_time.timestamp()`, recomputed only when `end_time` is recomputed (identity of the cached end_time changes)
+        end_time = self.end_time
+        if self._end_timestamp_key is not end_time:
+            self._end_timestamp = end_time.timestamp()
+            self._end_timestamp_key = end_time
+        return self._end_timestamp
 
     def __repr__(self):
         name = f"{self.prepend_name}-{self.name}" if self.prepend_name else self.name
@@ -52,7 +113,9 @@ class Activity(object):
         prepend_name = f"{self.prepend_name}-{prepend_name}" if self.prepend_name else prepend_name
         # append_name = f"{self.append_name}-{append_name}" if self.append_name else append_name
         x = Activity(self.start_time, self.duration, self.name, self.location, new_owner, prepend_name=prepend_name, append_name=self.append_name)
-        x._add_to_append_name(append_name)
+        if append_name:
+            # most clones (e.g. supervised copies of an adult's schedule) keep the name as is
+            x._add_to_append_name(append_name)
         x.parent_activity_pointer = self.parent_activity_pointer
         return x
 
@@ -259,9 +322,11 @@ class MobilityPlanner(object):
             if self.human.does_not_work:
                 does_work = np.zeros(n_days)
             else:
-                does_work = 1.0 * np.array([(todays_weekday + i) % 7 in self.human.working_days for i in range(n_days)])
-                n_working_days = (does_work > 0).sum()
-                does_work[does_work > 0] = [_sample_activity_duration("work", self.conf, self.rng) for _ in range(n_working_days)]
+                # all working days are known upfront, so their durations are drawn in a single call
+                weekdays = (todays_weekday + np.arange(n_days)) % 7
+                working = np.isin(weekdays, self.human.working_days)
+                does_work = np.zeros(n_days)
+                does_work[working] = _sample_activity_durations("work", self.conf, self.rng, working.sum())
 
             ## other activities
             does_grocery = _presample_activity("grocery", self.conf, self.rng, n_days)
@@ -1222,15 +1287,8 @@ def _get_open_close_times(activity_name, conf, location=None):
     if location is not None:
         return location.opening_time, location.closing_time
 
-    elif activity_name == "grocery":
-        location_type = "STORE"
-    elif activity_name == "socialize":
-        location_type = "MISC"
-    elif activity_name == "exercise":
-        location_type = "PARK"
-    elif activity_name in ["sleep", "idle"]:
-        location_type = "HOUSEHOLD"
-    else:
+    location_type = _ACTIVITY_TO_LOCATION_TYPE.get(activity_name)
+    if location_type is None:
         raise ValueError(f"Unknown activity_name:{activity_name}")
 
     # # /!\ same calculation is in covid19sim.locations.location.Location.__init__()
@@ -1240,6 +1298,30 @@ def _get_open_close_times(activity_name, conf, location=None):
 
     return opening_time, closing_time
 
+@functools.lru_cache(maxsize=None)
+def _get_days_to_next_activity_cdf(P_ACTIVITY_DAYS):
+    """
+    Computes the cumulative distribution of days after which next activity can be scheduled, the same way `rng.choice` does.
+
+    Args:
+        P_ACTIVITY_DAYS (tuple): each element is a tuple - (d, p), where
+                d is number of days after which this activity can be scheduled
+                p is the probability of sampling d days for this activity.
+                Note: p is normalized before being used.
+
+    Returns:
+        days (np.array): number of days after which next activity can be scheduled
+        cdf (np.array): cumulative probability of sampling up to the corresponding number of days
+    """
+    days = np.array([x[0] for x in P_ACTIVITY_DAYS])
+    p = np.array([x[1] for x in P_ACTIVITY_DAYS])
+    cdf = np.cumsum(p / p.sum())
+    cdf /= cdf[-1]
+    # shared by every call with the same configuration
+    days.setflags(write=False)
+    cdf.setflags(write=False)
+    return days, cdf
+
 def _sample_days_to_next_activity(P_ACTIVITY_DAYS, rng):
     """
     Samples days after which next activity can be scheduled.
@@ -1254,9 +1336,26 @@ def _sample_days_to_next_activity(P_ACTIVITY_DAYS, rng):
     Returns:
         (float): Number of days after which next activity can be scheduled
     """
-    p = np.array([x[1] for x in P_ACTIVITY_DAYS])
-    sampled_day = _random_choice(P_ACTIVITY_DAYS, size=1, P=p/p.sum(), rng=rng)[0]
-    return sampled_day[0]
+    return _sample_days_to_next_activities(P_ACTIVITY_DAYS, rng, 1)[0].item()
+
+def _sample_days_to_next_activities(P_ACTIVITY_DAYS, rng, size):
+    """
+    Vectorized version of `_sample_days_to_next_activity`. Draws the same sequence of days as `size` consecutive calls to it.
+
+    Args:
+        P_ACTIVITY_DAYS (list): each element is a list - [d, p], where
+                d is number of days after which this activity can be scheduled
+                p is the probability of sampling d days for this activity.
+                Note: p is normalized before being used.
+        rng (np.random.RandomState): Random number generator
+        size (int): number of days to sample
+
+    Returns:
+        (np.array): An array of size `size` containing number of days after which next activity can be scheduled
+    """
+    # same draws as rng.choice with these probabilities, without rebuilding and validating them on every call
+    days, cdf = _get_days_to_next_activity_cdf(tuple(map(tuple, P_ACTIVITY_DAYS)))
+    return days[cdf.searchsorted(rng.random_sample(size), side="right")]
 
 def _presample_activity(type_of_activity, conf, rng, n_days):
     """
@@ -1273,27 +1372,38 @@ def _presample_activity(type_of_activity, conf, rng, n_days):
     Returns:
         (np.array): An array of size `n_days` containing float, where x implies do that activity for x seconds
     """
-    if type_of_activity == "grocery":
-        P_ACTIVITY_DAYS = conf['P_GROCERY_SHOPPING_DAYS']
-    elif type_of_activity == "socialize":
-        P_ACTIVITY_DAYS = conf['P_SOCIALIZE_DAYS']
-    elif type_of_activity == "exercise":
-        P_ACTIVITY_DAYS = conf['P_EXERCISE_DAYS']
-    else:
-        raise ValueError
+    if type_of_activity not in _P_ACTIVITY_DAYS_KEYS:
+        raise ValueError(f"Unknown type_of_activity:{type_of_activity}")
+    P_ACTIVITY_DAYS = conf[_P_ACTIVITY_DAYS_KEYS[type_of_activity]]
 
-    total_days_sampled = 0
-    does_activity = np.zeros(n_days)
-    duration = np.zeros(n_days)
-    while total_days_sampled <= n_days:
-        days = _sample_days_to_next_activity(P_ACTIVITY_DAYS, rng)
-        total_days_sampled += days
-        if total_days_sampled >= n_days:
-            break
-        does_activity[days] = _sample_activity_duration(type_of_activity, conf, rng)
+    # every gap is at least the smallest one, so these many gaps always add up to more than `n_days`
+    n_gaps = n_days // min(x[0] for x in P_ACTIVITY_DAYS) + 1
+    activity_days = np.cumsum(_sample_days_to_next_activities(P_ACTIVITY_DAYS, rng, n_gaps))
+    activity_days = activity_days[activity_days < n_days]
 
+    does_activity = np.zeros(n_days)
+    does_activity[activity_days] = _sample_activity_durations(type_of_activity, conf, rng, len(activity_days))
     return does_activity
 
+def _get_activity_duration_parameters(activity, conf):
+    """
+    Fetches parameters of the distribution of the duration of `activity` from the configuration file.
+
+    Args:
+        activity (str): type of activity
+        conf (dict): yaml configuration of the experiment
+
+    Returns:
+        AVERAGE_TIME (float): average duration of `activity` (hours)
+        SCALE_FACTOR (float): scale of the gamma distribution
+        MAX_TIME (float): maximum duration of `activity` (hours)
+    """
+    if activity not in _ACTIVITY_DURATION_PARAMETER_KEYS:
+        raise ValueError(f"Unknown activity:{activity}")
+    AVERAGE_TIME_KEY, SCALE_FACTOR_KEY, MAX_TIME_KEY = _ACTIVITY_DURATION_PARAMETER_KEYS[activity]
+
+    return conf[AVERAGE_TIME_KEY], conf[SCALE_FACTOR_KEY], conf[MAX_TIME_KEY]
+
 def _sample_activity_duration(activity, conf, rng):
     """
     Samples duration for `activity` according to predefined distribution, parameters of which are defined in the configuration file.
@@ -1308,43 +1418,31 @@ def _sample_activity_duration(activity, conf, rng):
         (float): duration for which to conduct activity (seconds)
     """
     SECONDS_CONVERSION_FACTOR = SECONDS_PER_HOUR
+    AVERAGE_TIME, SCALE_FACTOR, MAX_TIME = _get_activity_duration_parameters(activity, conf)
 
-    if activity == "work":
-        AVERAGE_TIME = conf["AVERAGE_TIME_SPENT_WORK"]
-        SCALE_FACTOR = conf['TIME_SPENT_SCALE_FACTOR_FOR_WORK']
-        MAX_TIME = conf['MAX_TIME_WORK']
-
-    elif activity == "grocery":
-        AVERAGE_TIME = conf["AVERAGE_TIME_SPENT_GROCERY"]
-        SCALE_FACTOR = conf['TIME_SPENT_SCALE_FACTOR_FOR_SHORT_ACTIVITIES']
-        MAX_TIME = conf["MAX_TIME_SHORT_ACTVITIES"]
-
-    elif activity == "exercise":
-        AVERAGE_TIME = conf['AVERAGE_TIME_SPENT_EXERCISING']
-        SCALE_FACTOR = conf['TIME_SPENT_SCALE_FACTOR_FOR_SHORT_ACTIVITIES']
-        MAX_TIME = conf["MAX_TIME_SHORT_ACTVITIES"]
-
-    elif activity == "socialize":
-        AVERAGE_TIME = conf['AVERAGE_TIME_SPENT_SOCIALIZING']
-        SCALE_FACTOR = conf['TIME_SPENT_SCALE_FACTOR_FOR_SHORT_ACTIVITIES']
-        MAX_TIME = conf["MAX_TIME_SHORT_ACTVITIES"]
+    # round off to prevent microseconds in timestamps
+    duration = math.floor(rng.gamma(AVERAGE_TIME/SCALE_FACTOR, SCALE_FACTOR) * SECONDS_CONVERSION_FACTOR)
+    return min(duration, MAX_TIME * SECONDS_PER_HOUR)
 
-    elif activity == "sleep":
-        AVERAGE_TIME = conf['AVERAGE_TIME_SLEEPING']
-        SCALE_FACTOR = conf['TIME_SPENT_SCALE_FACTOR_SLEEP_AWAKE']
-        MAX_TIME = conf['MAX_TIME_SLEEP']
+def _sample_activity_durations(activity, conf, rng, size):
+    """
+    Vectorized version of `_sample_activity_duration`. Draws the same sequence of durations as `size` consecutive calls to it.
 
-    elif activity == "awake":
-        AVERAGE_TIME = conf['AVERAGE_TIME_AWAKE']
-        SCALE_FACTOR = conf['TIME_SPENT_SCALE_FACTOR_SLEEP_AWAKE']
-        MAX_TIME = conf['MAX_TIME_AWAKE']
+    Args:
+        activity (str): type of activity
+        conf (dict): yaml configuration of the experiment
+        rng (np.random.RandomState): Random number generator
+        size (int): number of durations to sample
 
-    else:
-        raise ValueError
+    Returns:
+        (np.array): An array of size `size` containing durations for which to conduct activity (seconds)
+    """
+    SECONDS_CONVERSION_FACTOR = SECONDS_PER_HOUR
+    AVERAGE_TIME, SCALE_FACTOR, MAX_TIME = _get_activity_duration_parameters(activity, conf)
 
     # round off to prevent microseconds in timestamps
-    duration = math.floor(rng.gamma(AVERAGE_TIME/SCALE_FACTOR, SCALE_FACTOR) * SECONDS_CONVERSION_FACTOR)
-    return min(duration, MAX_TIME * SECONDS_PER_HOUR)
+    durations = np.floor(rng.gamma(AVERAGE_TIME / SCALE_FACTOR, SCALE_FACTOR, size=size) * SECONDS_CONVERSION_FACTOR)
+    return np.minimum(durations, MAX_TIME * SECONDS_PER_HOUR)
 
 def _select_location(human, activity, city, rng, conf):
     """
@@ -18,7 +18,6 @@ import zipfile
 from orderedset import OrderedSet
 from pathlib import Path
 import time
-import dill
 import numpy as np
 import requests
 import yaml
@@ -226,6 +225,24 @@ def proba_to_risk_fn(mapping):
     return functools.partial(_proba_to_risk, mapping=mapping)
 
 
+@functools.lru_cache(maxsize=None)
+def cached_proba_to_risk_fn(mapping):
+    """
+    Same as `proba_to_risk_fn`, but builds the (read-only) mapping array only once for a given
+    mapping, so that all humans sharing a configuration also share the same array and callable.
+
+    Args:
+        mapping (tuple): The mapping from probabilities to discrete risk levels (must be hashable).
+
+    Returns:
+        callable: Function taking probabilities and returning discrete risk levels.
+    """
+    mapping_array = np.array(mapping)
+    assert len(mapping_array) > 0, "risk mapping must always be defined!"
+    mapping_array.setflags(write=False)
+    return proba_to_risk_fn(mapping_array)
+
+
 def calculate_average_infectiousness(human):
     """ This is only used for the infectiousness value for a human that is written out for the ML predictor.
     We write tomorrows infectiousness (and predict tomorrows infectiousness) so that our predictor is conservative. """
@@ -433,6 +450,7 @@ def dump_tracker_data(data, outdir, name):
         outdir (str): directory where to dump the file
         name (str): the dump file's name
     """
+    import dill  # lazy import: dill is slow to load and only needed here
     outdir = pathlib.Path(outdir)
     outdir.mkdir(exist_ok=True, parents=True)
     with open(outdir / name, 'wb') as f:
@@ -604,6 +622,24 @@ def subprocess_cmd(command):
     process = subprocess.Popen(command,stdout=subprocess.PIPE, shell=True)
     proc_stdout = process.communicate()[0].strip()
 
+def get_next_free_outdir(outdir):
+    """
+    Returns `outdir` suffixed with `_<idx>`, where `idx` is one more than the largest suffix already
+    used by a sibling directory. The parent directory is listed once instead of probing each index.
+
+    Args:
+        outdir (str): path of the output directory that is already taken
+
+    Returns:
+        (str): path of a free output directory
+    """
+    out_path = Path(outdir)
+    prefix = out_path.name + "_"
+    with os.scandir(out_path.parent) as entries:
+        suffixes = [entry.name[len(prefix):] for entry in entries if entry.name.startswith(prefix)]
+    out_idx = 1 + max((int(suffix) for suffix in suffixes if suffix.isdigit()), default=0)
+    return str(out_path.parent / f"{prefix}{out_idx}")
+
 def zip_outdir(outdir):
     path = Path(outdir).resolve()
     assert path.exists()
@@ -0,0 +1,81 @@
+import datetime
+
+import pytest
+
+from covid19sim.utils.mobility_planner import Activity
+
+START = datetime.datetime(2020, 2, 28, 8, 0)
+
+
+def _check_times(activity):
+    # read twice so that a stale cached value would show up on the second read as well
+    for _ in range(2):
+        assert activity.end_time == activity.start_time + datetime.timedelta(seconds=activity.duration)
+        assert activity.end_timestamp == activity.end_time.timestamp()
+        assert activity.start_timestamp == activity.start_time.timestamp()
+
+
+def _make_activity(duration=3600):
+    activity = Activity(START, duration, "exercise", None, None)
+    _check_times(activity)  # fills the caches
+    return activity
+
+
+def test_equal_but_distinct_start_time():
+    activity = _make_activity()
+    end_time = activity.end_time
+    activity.start_time = START + datetime.timedelta(0)
+    _check_times(activity)
+    assert activity.end_time == end_time
+
+
+def test_new_start_time():
+    activity = _make_activity()
+    activity.start_time = START + datetime.timedelta(minutes=30)
+    _check_times(activity)
+    assert activity.end_time == START + datetime.timedelta(minutes=90)
+
+
+@pytest.mark.parametrize('duration', [0, 1800, 1800.5, 7200])
+def test_new_duration(duration):
+    activity = _make_activity()
+    activity.duration = duration
+    _check_times(activity)
+    assert activity.end_time == START + datetime.timedelta(seconds=duration)
+
+
+@pytest.mark.parametrize('start', [True, False])
+def test_adjust_time(start):
+    activity = _make_activity()
+    activity.adjust_time(600, start=start)
+    _check_times(activity)
+    if start:
+        assert (activity.start_time, activity.end_time) == (START + datetime.timedelta(minutes=10), START + datetime.timedelta(hours=1))
+    else:
+        assert (activity.start_time, activity.end_time) == (START, START + datetime.timedelta(minutes=70))
+
+
+def test_clone():
+    activity = _make_activity()
+    clone = activity.clone(prepend_name="supervised")
+    _check_times(clone)
+    assert clone.end_time == activity.end_time
+
+    # the clone's cache is independent of the original's
+    clone.duration = 60
+    _check_times(clone)
+    _check_times(activity)
+    assert activity.end_time == START + datetime.timedelta(hours=1)
+
+
+@pytest.mark.parametrize('cut_left', [True, False])
+def test_align(cut_left):
+    activity = _make_activity()
+    new_activity = Activity(START + datetime.timedelta(minutes=20), 1200, "socialize", None, None)
+    aligned = activity.align(new_activity, cut_left=cut_left)
+    _check_times(aligned)
+    _check_times(activity)
+    if cut_left:
+        assert (aligned.start_time, aligned.end_time) == (new_activity.end_time, activity.end_time)
+    else:
+        assert (aligned.start_time, aligned.end_time) == (activity.start_time, new_activity.start_time)
@@ -0,0 +1,107 @@
+import datetime
+
+import pytest
+
+from covid19sim.interactivity.interactive_planner import _modify_schedule
+from covid19sim.utils.mobility_planner import Activity
+
+START = datetime.datetime(2020, 2, 28, 8, 0)
+HUMAN = object()  # only used as the owner of the activities that are cut
+
+
+def _at(minutes):
+    return START + datetime.timedelta(minutes=minutes)
+
+
+def _make_schedule(activities, start=0):
+    """
+    builds contiguous activities from (name, duration in minutes), the first one starting `start` minutes after START.
+    """
+    schedule, start_time = [], _at(start)
+    for name, minutes in activities:
+        schedule.append(Activity(start_time, minutes * 60, name, None, HUMAN))
+        start_time = schedule[-1].end_time
+    return schedule
+
+
+def _modify(new_schedule, start, end, name="socialize"):
+    remaining_schedule = _make_schedule([("idle", 30)], start=-30)
+    new_activity = Activity(_at(start), (end - start) * 60, name, None, HUMAN)
+    schedule, valid = _modify_schedule(HUMAN, remaining_schedule, new_activity, new_schedule)
+    return [(x.name, x.start_time, x.end_time) for x in schedule], valid, new_activity
+
+
+def _expected(*activities):
+    return [(name, _at(start), _at(end)) for name, start, end in activities]
+
+
+def test_new_activity_within_an_activity():
+    new_schedule = _make_schedule([("idle", 60), ("exercise", 60), ("sleep", 480)])
+    schedule, valid, _ = _modify(new_schedule, 30, 90)
+    assert valid
+    assert schedule == _expected(("idle", 0, 30), ("socialize", 30, 90), ("exercise", 90, 120), ("sleep", 120, 600))
+
+
+def test_new_activity_on_activity_boundaries():
+    new_schedule = _make_schedule([("idle", 60), ("exercise", 60), ("grocery", 30), ("sleep", 480)])
+    schedule, valid, _ = _modify(new_schedule, 60, 150)
+    assert valid
+    assert schedule == _expected(("idle", 0, 60), ("socialize", 60, 150), ("sleep", 150, 630))
+
+
+@pytest.mark.parametrize('start, end, expected', [
+    # starts on a boundary, ends within an activity
+    (60, 90, [("idle", 0, 60), ("socialize", 60, 90), ("exercise", 90, 120), ("sleep", 120, 600)]),
+    # starts within an activity, ends on a boundary
+    (30, 60, [("idle", 0, 30), ("socialize", 30, 60), ("exercise", 60, 120), ("sleep", 120, 600)]),
+    # spans several activities
+    (30, 150, [("idle", 0, 30), ("socialize", 30, 150), ("sleep", 150, 600)]),
+])
+def test_new_activity_partially_on_boundaries(start, end, expected):
+    new_schedule = _make_schedule([("idle", 60), ("exercise", 60), ("sleep", 480)])
+    schedule, valid, _ = _modify(new_schedule, start, end)
+    assert valid
+    assert schedule == _expected(*expected)
+
+
+def test_zero_length_activity_at_the_end_of_new_activity():
+    new_schedule = _make_schedule([("idle", 60), ("grocery", 0), ("exercise", 60), ("sleep", 480)])
+    schedule, valid, _ = _modify(new_schedule, 30, 60)
+    assert valid
+    # activities without duration are dropped from the schedule
+    assert schedule == _expected(("idle", 0, 30), ("socialize", 30, 60), ("exercise", 60, 120), ("sleep", 120, 600))
+
+
+def test_zero_length_activity_at_the_start_of_new_activity():
+    new_schedule = _make_schedule([("idle", 60), ("grocery", 0), ("exercise", 60), ("sleep", 480)])
+    schedule, valid, _ = _modify(new_schedule, 60, 90)
+    assert valid
+    assert schedule == _expected(("idle", 0, 60), ("socialize", 60, 90), ("exercise", 90, 120), ("sleep", 120, 600))
+
+
+def test_new_activity_goes_in_once():
+    new_schedule = _make_schedule([("idle", 60), ("exercise", 60), ("sleep", 480)])
+    remaining_schedule = _make_schedule([("idle", 30)], start=-30)
+    new_activity = Activity(_at(30), 60 * 60, "socialize", None, HUMAN)
+    schedule, valid = _modify_schedule(HUMAN, remaining_schedule, new_activity, new_schedule)
+    assert valid
+    assert sum(x is new_activity for x in schedule) == 1
+    # untouched activities are kept as they are, cut ones are copies
+    assert schedule[-1] is new_schedule[-1]
+    assert schedule[0] is not new_schedule[0] and new_schedule[0].end_time == _at(60)
+
+
+@pytest.mark.parametrize('start, end', [
+    # ends before the remaining schedule does
+    (-60, -10),
+    # starts before the remaining schedule ends
+    (-10, 30),
+    # lies within work
+    (90, 120),
+    (60, 120),
+])
+def test_rejected_edits(start, end):
+    new_schedule = _make_schedule([("idle", 60), ("work", 480), ("sleep", 480)])
+    schedule, valid, _ = _modify(new_schedule, start, end)
+    assert not valid
+    assert schedule == []
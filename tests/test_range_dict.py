@@ -0,0 +1,82 @@
+import pytest
+
+from covid19sim.interactivity.interactive_planner import RangeDict, RangDictKeyException
+
+
+def _make_range_dict():
+    rd = RangeDict()
+    # inserted out of order on purpose
+    rd[(20.0, 30.0)] = "c"
+    rd[(0.0, 10.0)] = "a"
+    rd[(10.0, 20.0)] = "b"
+    rd[(40.0, 50.0)] = "d"
+    return rd
+
+
+def test_point_lookup():
+    rd = _make_range_dict()
+    assert len(rd) == 4
+    assert rd[0.0] == "a"
+    assert rd[9.5] == "a"
+    assert rd[10.0] == "b"
+    assert rd[(20.0, 30.0)] == "c"
+    assert list(rd) == [(0.0, 10.0), (10.0, 20.0), (20.0, 30.0), (40.0, 50.0)]
+
+    # gaps and out of bounds keys are not contained in any range
+    for key in [-1.0, 30.0, 35.0, 50.0]:
+        with pytest.raises(RangDictKeyException):
+            rd[key]
+
+
+@pytest.mark.parametrize('key', [(5.0, 15.0), (25.0, 45.0), (0.0, 1.0), (-5.0, 1.0), (45.0, 60.0), (3.0, 3.0), (3.0, 1.0)])
+def test_overlapping_or_invalid_ranges_are_rejected(key):
+    rd = _make_range_dict()
+    with pytest.raises(RangDictKeyException):
+        rd[key] = "x"
+    assert len(rd) == 4
+
+
+def test_delete_and_reinsert():
+    rd = _make_range_dict()
+    del rd[15.0]
+    assert len(rd) == 3
+    with pytest.raises(RangDictKeyException):
+        rd[15.0]
+
+    rd[(10.0, 15.0)] = "b1"
+    rd[(15.0, 20.0)] = "b2"
+    assert rd.get_range(0.0, 29.0) == ["a", "b1", "b2", "c"]
+
+
+def test_get_range():
+    rd = _make_range_dict()
+    assert rd.get_range(5.0, 25.0) == ["a", "b", "c"]
+    assert rd.get_range(10.0, 10.0) == ["b"]
+    # without an end, or with an end outside of every range, the range is open-ended
+    assert rd.get_range(10.0) == ["b", "c", "d"]
+    assert rd.get_range(10.0, 35.0) == ["b", "c", "d"]
+    # a start outside of every range gives nothing
+    assert rd.get_range(35.0, 45.0) == []
+
+
+def test_bulk_load():
+    rd = RangeDict()
+    rd[(0.0, 10.0)] = "a"
+    rd.bulk_load([(40.0, 50.0), (10.0, 20.0), (20.0, 30.0)], ["d", "b", "c"])
+    assert list(rd) == [(0.0, 10.0), (10.0, 20.0), (20.0, 30.0), (40.0, 50.0)]
+    assert rd.get_range(0.0, 45.0) == ["a", "b", "c", "d"]
+
+    # an overlapping range rejects the whole batch
+    with pytest.raises(RangDictKeyException):
+        rd.bulk_load([(60.0, 70.0), (45.0, 55.0)], ["e", "f"])
+    assert len(rd) == 4
+
+
+def test_delete_range():
+    rd = _make_range_dict()
+    rd.delete_range(10.0, 29.0)
+    assert list(rd) == [(0.0, 10.0), (40.0, 50.0)]
+
+    # nothing is deleted if the start is not within a range
+    rd.delete_range(35.0, 45.0)
+    assert len(rd) == 2
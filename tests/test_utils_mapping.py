@@ -1,7 +1,7 @@
 import pytest
 import numpy as np
 
-from covid19sim.utils.utils import probas_to_risk_mapping, proba_to_risk_fn
+from covid19sim.utils.utils import probas_to_risk_mapping, proba_to_risk_fn, cached_proba_to_risk_fn
 
 
 probabilities = np.array([
@@ -67,3 +67,16 @@ def test_proba_to_risk_fn(num_bins):
     # The risk levels should be in [0, num_bins - 1]
     assert np.all(risk_levels >= 0)
     assert np.all(risk_levels < num_bins)
+
+
+@pytest.mark.parametrize('num_bins', [4, 16])
+def test_cached_proba_to_risk_fn(num_bins):
+    mapping = tuple(np.linspace(0, 1, num_bins + 1).tolist())
+    proba_to_risk = cached_proba_to_risk_fn(mapping)
+
+    # Same mapping gives back the same (shared) callable
+    assert cached_proba_to_risk_fn(mapping) is proba_to_risk
+
+    # Results match the non-cached version
+    expected = proba_to_risk_fn(np.array(mapping))(probabilities)
+    np.testing.assert_array_equal(proba_to_risk(probabilities), expected)